@@ -1,23 +1,31 @@
-from typing import Dict, List, Set
+from typing import Dict, FrozenSet, Iterable, List
+from innovations.innovation import innovation_bit
+
+_EMPTY: FrozenSet[str] = frozenset()
 
 class CommandRegistry:
-    _registry: Dict[str, List[str]] = {}
+    _registry: Dict[str, FrozenSet[str]] = {}
+    _required_masks: Dict[str, int] = {}
 
     @classmethod
-    def register(cls, command_key: str, required_innovations: List[str]):
+    def register(cls, command_key: str, required_innovations: Iterable[str]):
         """Register a command with its required innovations."""
-        cls._registry[command_key] = required_innovations
+        required = frozenset(required_innovations)
+        cls._registry[command_key] = required
+        mask = 0
+        for name in required:
+            mask |= innovation_bit(name)
+        cls._required_masks[command_key] = mask
 
     @classmethod
     def get_required_innovations(cls, command_key: str) -> List[str]:
         """Get the list of innovations required for a command."""
-        return cls._registry.get(command_key, [])
+        return list(cls._registry.get(command_key, _EMPTY))
 
     @classmethod
-    def is_command_available(cls, command_key: str, discovered: Set[str]) -> bool:
-        """Check if a command is available based on discovered innovations."""
-        required = cls.get_required_innovations(command_key)
-        return all(req in discovered for req in required)
+    def is_command_available(cls, command_key: str, discovered_mask: int) -> bool:
+        """Check if a command is available based on the discovered innovations bitmask."""
+        return cls._required_masks.get(command_key, 0) & ~discovered_mask == 0
 
 # Register all existing commands with their prerequisites
 CommandRegistry.register("assign_role", ["Chieftainship"])
@@ -1,4 +1,5 @@
-from typing import List, Tuple, Callable, Set
+import logging
+from typing import Dict, List, Tuple, Callable, Set
 from world.player import Player
 from core.interfaces import get_interface
 from core.government_types import get_available_government_types
@@ -7,12 +8,16 @@ from innovations.innovation_map import ROLE_INNOVATION_MAP
 from utils.utils import choose_from_list
 from utils.messages import Messages
 from utils.logging_config import logger
-from core.prompt import PromptManager
+from core.prompt import PromptManager, build_dispatch_map
+
+# The role map is static, so sort it once instead of on every listing
+_SORTED_ROLE_INNOVATIONS = {role: sorted(innovs, key=lambda x: x.name) for role, innovs in ROLE_INNOVATION_MAP.items()}
 
 class CommandHandler:
     def __init__(self, simulation: 'core.main.Simulation'):
         self.sim = simulation
         self.prompt_manager = PromptManager(simulation)
+        self._dispatch_map: Dict[str, Callable[[], None]] = {}  # Dispatch map of the last rendered menu
         self.commands: List[Tuple[str, str, Callable[[], None]]] = [
             ("list_players", "Show all players and their roles", self.do_list_players),
             ("list_roles", "Show available roles", self.do_list_roles),
@@ -24,48 +29,47 @@ class CommandHandler:
             ("nominate", "Nominate a candidate for a role", self.do_nominate),
             ("appoint_player_to_role", "Appoint a player to a role", self.do_appoint_player_to_role),
         ]
+        # Informational commands; the prompt shown before them is still valid afterwards
+        self.read_only_actions = {
+            action for key, _, action in self.commands if key in ("list_players", "list_roles", "list_innovations")
+        }
 
     def do_list_players(self):
         """Display all players and their roles."""
-        for p in self.sim.players:
-            print(p)
+        print("\n".join(str(p) for p in self.sim.players))
         input("Press Enter to continue...")
 
     def do_list_roles(self):
         """Display available roles."""
-        titled_roles = list(self.sim.government.government_type.role_mappings.keys())
+        titled_roles = list(self.sim.government.government_type.titled_role_names)
         print("Available Roles:", titled_roles or "None")
         input("Press Enter to continue...")
 
     def get_prereq_icon(self, innov_name: str) -> str:
         """Get the icon for an innovation's prerequisite."""
-        logger.debug(f"Querying icon for innovation {innov_name}")
-        for role, innovations in ROLE_INNOVATION_MAP.items():
-            for innov in innovations:
-                if innov.name == innov_name:
-                    logger.debug(f"Found {innov_name} in role {role} with icon {innov.icon}")
-                    return innov.icon
         innov = ALL_INNOVATIONS.get(innov_name)
-        icon = innov.icon if innov else "?"
-        logger.debug(f"Using fallback icon {icon} for {innov_name}")
-        return icon
+        return innov.icon if innov else "?"
 
     def build_innovation_list(self, discovered: Set[str], role_key: str) -> List[str]:
         """Build a formatted list of innovations for a role."""
         role_innovations = ROLE_INNOVATION_MAP.get(role_key, [])
-        logger.debug(f"Role {role_key} innovations: {[innov.name for innov in role_innovations]}")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Role %s innovations: %s", role_key, [innov.name for innov in role_innovations])
         if not role_innovations:
             return [f"No innovations for role {role_key.capitalize()}."]
         lines = []
-        for innov in sorted(role_innovations, key=lambda x: x.name):
-            logger.debug(f"Processing innovation {innov.name}")
+        for innov in _SORTED_ROLE_INNOVATIONS[role_key]:
+            if debug:
+                logger.debug("Processing innovation %s", innov.name)
             status = "[X]" if innov.name in discovered else ""
             lines.append(f"{innov.icon} {innov.name} {status} - {innov.description} [Cost: {innov.cost}]")
             if innov.prerequisites:
                 prereq_list = []
-                for prereq in sorted(innov.prerequisites):
+                for prereq in innov.prerequisites_ordered:
                     if prereq not in ALL_INNOVATIONS:
-                        logger.debug(f"Prerequisite {prereq} not found in ALL_INNOVATIONS")
+                        if debug:
+                            logger.debug("Prerequisite %s not found in ALL_INNOVATIONS", prereq)
                         continue
                     prereq_icon = self.get_prereq_icon(prereq)
                     prereq_list.append(f"{prereq_icon}{prereq}")
@@ -90,8 +94,7 @@ class CommandHandler:
         print(f"{selected_role.capitalize()} Innovations:")
         discovered = self.sim.government.innovation_pool.discovered
         list_lines = self.build_innovation_list(discovered, selected_role)
-        for line in list_lines:
-            print(line)
+        print("\n".join(list_lines))
         input("Press Enter to continue...")
 
     def do_set_government_type(self):
@@ -124,7 +127,7 @@ class CommandHandler:
 
     def do_open_role_interface(self):
         """Open a role interface for the current player."""
-        current_player = self.sim.players[self.sim.current_player_index]
+        current_player = self.sim.current_player
         interfaces = self.sim.government.get_player_interfaces(current_player)
         if not interfaces:
             Messages.add("No role interfaces available.")
@@ -140,13 +143,9 @@ class CommandHandler:
             self.sim.voting_manager.initiate_votes()
 
     def do_appoint_player_to_role(self):
-        current_player = self.sim.players[self.sim.current_player_index]
+        current_player = self.sim.current_player
         # Find roles the current player can appoint for
-        appointable_roles = [
-            role_id for role_id, reqs in self.sim.government.government_type.title_requirements.items()
-            if reqs.get("selection_method") == "appointment"
-               and current_player in self.sim.government.get_role_holders(reqs.get("appointer"))
-        ]
+        appointable_roles = self.sim.government.get_appointable_roles(current_player)
         if not appointable_roles:
             Messages.add("No roles available to appoint.")
             logger.info("No roles available to appoint")
@@ -160,17 +159,22 @@ class CommandHandler:
 
     # In commands.py
     def do_nominate(self):
-        current_player = self.sim.players[self.sim.current_player_index]
-        eligible_votes = [
-            vote for vote in self.sim.voting_manager.active_votes
-            if vote.is_nomination_open and (
-                    vote.nomination_method == "open" or
-                    (vote.nomination_method == "self_appointed" and current_player.name not in vote.nominations[
-                        vote.role]) or
-                    (vote.nomination_method == "appointed" and vote.can_appoint(current_player, vote.role))
-            )
-        ]
-        logger.debug(f"Eligible votes for {current_player.name}: {[v.role for v in eligible_votes]}")
+        current_player = self.sim.current_player
+        nominating_votes = self.sim.voting_manager.nominating_votes
+        player_name = current_player.name
+        eligible = set(nominating_votes.get("open", ()))
+        eligible.update(
+            vote for vote in nominating_votes.get("self_appointed", ())
+            if player_name not in vote.nominated_names
+        )
+        eligible.update(
+            vote for vote in nominating_votes.get("appointed", ())
+            if vote.can_appoint(current_player, vote.role)
+        )
+        # List them in active_votes order so menu numbers stay stable
+        eligible_votes = [vote for vote in self.sim.voting_manager.active_votes if vote in eligible]
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Eligible votes for %s: %s", current_player.name, [v.role for v in eligible_votes])
         if not eligible_votes:
             Messages.add("No roles available for nomination.")
             logger.info("No roles available for nomination")
@@ -207,33 +211,30 @@ class CommandHandler:
         try:
             selected_vote.nominate(current_player, selected_candidate.name)
             Messages.add(f"{current_player.name} nominated {selected_candidate.name} for {selected_role}")
-            logger.debug(
-                f"Nominated {selected_candidate.name} for {selected_role}. Current nominations: {selected_vote.nominations[selected_role]}")
+            logger.debug("Nominated %s for %s. Current nominations: %s",
+                         selected_candidate.name, selected_role, selected_vote.nominations[selected_role])
         except ValueError as e:
             print(f"Error: {e}")
             logger.error(f"Nomination error: {e}")
             input("Press Enter to continue...")
 
 
-    def get_prompt(self) -> Tuple[str, List[Tuple[int, Callable[[], None], str]]]:
-        """Delegate prompt generation to PromptManager."""
-        return self.prompt_manager.get_prompt()
+    def get_prompt(self) -> Tuple[str, List[Tuple[int, Callable[[], None], str]], Dict[str, Callable[[], None]]]:
+        """Delegate prompt generation to PromptManager and index the menu for dispatch."""
+        prompt, menu_items = self.prompt_manager.get_prompt()
+        self._dispatch_map = build_dispatch_map(menu_items)
+        return prompt, menu_items, self._dispatch_map
 
     def execute(self, command: str):
-        """Execute a command based on user input."""
-        prompt, menu_items = self.get_prompt()
-        try:
-            num = int(command)
-            for number, action, key in menu_items:
-                if number == num:
-                    action()
-                    return
+        """Execute a command based on user input, against the menu last shown."""
+        if not self._dispatch_map:
+            self.get_prompt()
+        action = self._dispatch_map.get(command)
+        if action:
+            action()
+        elif command.isdigit():
             Messages.add("Invalid selection.")
             logger.info("Invalid command selection")
-        except ValueError:
-            for number, action, key in menu_items:
-                if command == key:
-                    action()
-                    return
+        else:
             Messages.add("Unknown command.")
             logger.info("Unknown command entered")
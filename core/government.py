@@ -1,4 +1,4 @@
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set, Tuple
 from innovations.innovation import InnovationPool
 from core.role import get_role
 from core.rules import is_role_unlocked, can_assign_role
@@ -15,11 +15,42 @@ class Government:
         self.sim = simulation  # Store the simulation reference
         self.innovation_pool = InnovationPool()
         self.players: List[Player] = []
+        self.player_names: Set[str] = set()  # Names of self.players, kept in step by add_player
         self.government_type: GovernmentType = get_government_type("tribal")
         self.assignments: Dict[str, List[Player]] = {key: [] for key in self.government_type.role_mappings}
         self.selection_methods: Dict[str, str] = {key: "" for key in self.government_type.role_mappings}
         self.research_queue: List[str] = []
+        self.research_queue_set: Set[str] = set()  # Members of research_queue, for membership checks
+        self._research_queue_str: Optional[str] = None  # Display form of research_queue, see research_queue_changed
         self.dice_bag = DiceBag()
+        self.assignments_version = 0  # Bumped whenever assignments change
+        self._interface_cache: Dict[Tuple[int, int], List[RoleInterface]] = {}
+        self._assigned_by_role: Dict[str, Set[str]] = {}  # Role -> names of its holders
+        self._player_roles: Dict[Player, List[str]] = {}  # Player -> titled roles held, in assignments order
+
+    def _assignments_changed(self):
+        """Invalidate data derived from assignments."""
+        self.assignments_version += 1
+        self._interface_cache.clear()
+        self._assigned_by_role = {
+            role_id: {p.name for p in holders} for role_id, holders in self.assignments.items() if holders
+        }
+        self._player_roles = {}
+        for role_id, holders in self.assignments.items():
+            # Role keys are unique, so a role can only repeat for a player listed twice under it
+            for holder in set(holders):
+                self._player_roles.setdefault(holder, []).append(role_id)
+
+    def research_queue_changed(self):
+        """Drop the cached display form of the research queue; call after editing research_queue."""
+        self._research_queue_str = None
+
+    @property
+    def research_queue_str(self) -> str:
+        """Comma-separated research queue for display, or "Empty"."""
+        if self._research_queue_str is None:
+            self._research_queue_str = ", ".join(self.research_queue) or "Empty"
+        return self._research_queue_str
 
     def get_role_points(self) -> Dict[str, int]:
         """Get innovation points generated by each role."""
@@ -31,6 +62,7 @@ class Government:
             self.innovation_pool.discover(name)
         self.government_type = get_government_type("tribal")
         self.assignments.update({key: [] for key in self.government_type.role_mappings})
+        self._assignments_changed()
         if self.players and not self.get_role_holders("Clan Leader"):
             leader = get_player_by_id(1)  # Player 1 (Alice)
             if leader:
@@ -46,10 +78,11 @@ class Government:
 
     def add_player(self, player: Player):
         self.players.append(player)
+        self.player_names.add(player.name)
 
     def is_player_assigned(self, player_name: str, role_id: str) -> bool:
         """Check if a player is assigned to a specific role."""
-        return any(p.name == player_name for p in self.assignments.get(role_id, []))
+        return player_name in self._assigned_by_role.get(role_id, ())
 
     def discover_innovation(self, innovation_name: str) -> bool:
         success = self.innovation_pool.discover(innovation_name)
@@ -60,6 +93,7 @@ class Government:
                                                       self.innovation_pool.discovered, self.government_type)
                     if not success:
                         self.assignments[role_id] = []
+                        self._assignments_changed()
                         Messages.add(f"Role '{role_id}' reset due to new innovation requirements")
         return success
 
@@ -77,12 +111,12 @@ class Government:
         self.innovation_pool.add_points(total_new_points)
 
     def appoint_player_to_role(self, appointer: Player, role_id: str, appointee: Player) -> bool:
-        title_reqs = self.government_type.title_requirements.get(role_id, {})
-        if title_reqs.get("selection_method") != "appointment":
+        title_reqs = self.government_type.get_title_requirements(role_id)
+        if title_reqs.selection_method != "appointment":
             Messages.add(f"{role_id} cannot be appointed.")
             return False
-        appointer_role = title_reqs.get("appointer")
-        if not appointer_role or appointer not in self.assignments.get(appointer_role, []):
+        appointer_role = title_reqs.appointer
+        if not appointer_role or not self.is_player_assigned(appointer.name, appointer_role):
             Messages.add(f"Only {appointer_role} can appoint {role_id}.")
             return False
         success, reasons = can_assign_role(role_id, appointee, self.assignments, self.innovation_pool.discovered,
@@ -104,11 +138,12 @@ class Government:
             return False
         if role_id in self.government_type.role_mappings:
             self.assignments.setdefault(role_id, []).append(player)
+            self._assignments_changed()
             assigned_any = False
             for base_role in self.government_type.role_mappings[role_id]:
                 unlocked, base_reasons = is_role_unlocked(base_role, self.innovation_pool.discovered)
                 if unlocked and get_role(base_role):
-                    if base_role not in player.assigned_roles:  # Simplified check
+                    if not player.has_role(base_role):  # Simplified check
                         player.assign_role(base_role)
                         assigned_any = True
                 else:
@@ -119,6 +154,7 @@ class Government:
                 return True
             else:
                 self.assignments[role_id].remove(player)
+                self._assignments_changed()
                 Messages.add(f"Failed to assign '{role_id}' to {player.name}: No valid base roles available")
                 logger.error(f"No valid base roles for {player.name} in {role_id}")
                 return False
@@ -128,27 +164,42 @@ class Government:
     def remove_role(self, role_id: str, player: Player) -> bool:
         if role_id in self.assignments and player in self.assignments[role_id]:
             self.assignments[role_id].remove(player)
+            self._assignments_changed()
             for base_role in self.government_type.role_mappings.get(role_id, []):
-                if base_role in player.assigned_roles:
-                    player.assigned_roles.remove(base_role)
+                player.unassign_role(base_role)
             Messages.add(f"Removed {player.name} from '{role_id}'")
             return True
         Messages.add(f"Failed to remove {player.name} from '{role_id}': Not assigned")
         return False
 
+    def get_player_titles(self, player: Player) -> List[str]:
+        """Get the titled roles a player currently holds."""
+        return list(self._player_roles.get(player, ()))
+
+    def get_appointable_roles(self, player: Player) -> List[str]:
+        """Get the titled roles a player may fill by appointment through the titles they hold."""
+        roles_by_appointer = self.government_type.appointment_roles_by_appointer
+        return [role_id for title in self._player_roles.get(player, ()) for role_id in roles_by_appointer.get(title, ())]
+
     def get_role_holders(self, role_id: str) -> List[Player]:
         return self.assignments.get(role_id, [])
 
     def get_player_interfaces(self, player: Player) -> List[RoleInterface]:
-        return self.government_type.get_accessible_interfaces(player, self.assignments)
+        key = (id(player), self.assignments_version)
+        interfaces = self._interface_cache.get(key)
+        if interfaces is None:
+            interfaces = self.government_type.get_title_interfaces(self._player_roles.get(player, ()))
+            self._interface_cache[key] = interfaces
+        return list(interfaces)
 
     def set_government_type(self, government_type_name: str) -> bool:
         new_type = get_government_type(government_type_name)
         if new_type and new_type.is_available(self.innovation_pool.discovered):
             self.government_type = new_type
             self.assignments = {key: [] for key in new_type.role_mappings}
+            self._assignments_changed()
             for player in self.players:
-                player.assigned_roles = []
+                player.clear_roles()
             return True
         return False
 
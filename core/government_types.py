@@ -1,30 +1,89 @@
-from typing import Dict, List, Set
+import sys
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 from core.interfaces import RoleInterface
-from world.player import Player
+from core.roles_config import ROLE_CONFIGS
+
+@dataclass(frozen=True, slots=True)
+class TitleReq:
+    """Requirements for holding a titled role; defaults apply to keys a title leaves out."""
+    innovations: Tuple[str, ...] = ()
+    max_holders: int = 1
+    selection_method: Optional[str] = None
+    appointer: Optional[str] = None
+    voting_system: str = "first_past_the_post"
+    nomination_method: str = "open"
+    force_vote: bool = False
+    nomination_control: str = "time_based"
+    nomination_duration: int = 1
+    nomination_starter_role: Optional[str] = None
+    nomination_closer_role: Optional[str] = None
+
+    def __post_init__(self):
+        object.__setattr__(self, "innovations", tuple(sys.intern(name) for name in self.innovations))
+        if self.appointer:
+            object.__setattr__(self, "appointer", sys.intern(self.appointer))
+
+_DEFAULT_TITLE_REQ = TitleReq()
 
 class GovernmentType:
-    def __init__(self, name: str, role_mappings: Dict[str, List[str]], required_innovations: Set[str], title_requirements: Dict[str, Dict[str, any]]):
+    def __init__(self, name: str, role_mappings: Dict[str, List[str]], required_innovations: Iterable[str], title_requirements: Dict[str, Dict[str, any]]):
         self.name = name
-        self.role_mappings = role_mappings
-        self.required_innovations = required_innovations
-        self.title_requirements = title_requirements
+        # Role keys are shared across assignments, requirements and role maps, so intern them once here
+        self.role_mappings: Dict[str, Tuple[str, ...]] = {
+            sys.intern(role_id): tuple(sys.intern(base_role) for base_role in base_roles)
+            for role_id, base_roles in role_mappings.items()
+        }
+        self.titled_role_names: Tuple[str, ...] = tuple(role_mappings)
+        self.required_innovations: FrozenSet[str] = frozenset(sys.intern(name) for name in required_innovations)
+        self.title_requirements: Dict[str, TitleReq] = {
+            sys.intern(role_id): TitleReq(**reqs) for role_id, reqs in title_requirements.items()
+        }
+        # Titled role -> role (or "anyone") that appoints its nominees, None when nobody does
+        self.appointer_by_role: Dict[str, Optional[str]] = {
+            role_id: reqs.appointer for role_id, reqs in self.title_requirements.items()
+        }
+        # Appointer role -> titled roles it may fill by appointment
+        self.appointment_roles_by_appointer: Dict[str, Tuple[str, ...]] = {}
+        for role_id, reqs in self.title_requirements.items():
+            if reqs.selection_method == "appointment":
+                appointer = reqs.appointer
+                self.appointment_roles_by_appointer[appointer] = self.appointment_roles_by_appointer.get(appointer, ()) + (role_id,)
+        # Title -> (base roles that exist, base roles that don't); role configs are fixed at import
+        self.base_role_validity: Dict[str, Tuple[FrozenSet[str], Tuple[str, ...]]] = {
+            title: (frozenset(b for b in bases if b in ROLE_CONFIGS), tuple(b for b in bases if b not in ROLE_CONFIGS))
+            for title, bases in self.role_mappings.items()
+        }
+        # (role, requirements, required innovations) for titles filled by voting, so vote setup skips the rest
+        self.voting_roles: Tuple[Tuple[str, TitleReq, FrozenSet[str]], ...] = tuple(
+            (role_id, reqs, frozenset(reqs.innovations)) for role_id, reqs in self.title_requirements.items()
+            if reqs.selection_method == "voting"
+        )
+        # (role, max_holders) for titles filled by divine appointment
+        self.divine_appointment_roles: Tuple[Tuple[str, int], ...] = tuple(
+            (role_id, reqs.max_holders) for role_id, reqs in self.title_requirements.items()
+            if reqs.selection_method == "divine_appointment"
+        )
+
+    def get_title_requirements(self, role_id: str) -> TitleReq:
+        return self.title_requirements.get(role_id, _DEFAULT_TITLE_REQ)
 
     def is_available(self, discovered: Set[str]) -> bool:
-        return all(req in discovered for req in self.required_innovations)
+        return self.required_innovations.issubset(discovered)
 
-    def get_accessible_interfaces(self, player: Player, assignments: Dict[str, List[Player]]) -> List[RoleInterface]:
+    def get_title_interfaces(self, titled_roles: Iterable[str]) -> List[RoleInterface]:
+        """Get the interfaces of the base roles behind the given titles."""
         from core.interfaces import get_interface
         interfaces = set()
-        for titled_role, holders in assignments.items():
-            if player in holders and titled_role in self.role_mappings:
-                for base_role in self.role_mappings[titled_role]:
-                    interface = get_interface(base_role)
-                    if interface:
-                        interfaces.add(interface)
+        for titled_role in titled_roles:
+            for base_role in self.role_mappings.get(titled_role, ()):
+                interface = get_interface(base_role)
+                if interface:
+                    interfaces.add(interface)
         return list(interfaces)
 
     def is_valid_selection_method(self, role_id: str, method_key: str, discovered: Set[str]) -> bool:
-        return role_id in self.role_mappings and method_key == self.title_requirements.get(role_id, {}).get("selection_method")
+        return role_id in self.role_mappings and method_key == self.get_title_requirements(role_id).selection_method
 
 GOVERNMENT_TYPES = {
     "tribal": GovernmentType(
@@ -1,4 +1,5 @@
-from typing import Dict, Callable, List, Optional
+from functools import partial
+from typing import Dict, Callable, List, Optional, Tuple
 from core.command_registry import CommandRegistry
 from world.player import Player
 from innovations.innovation_map import ROLE_INNOVATION_MAP
@@ -10,6 +11,7 @@ from utils.messages import Messages
 class RoleInterface:
     def __init__(self, government: 'core.government.Government', role_key: str):
         self.role_key = role_key
+        self._role_innovations = tuple(ROLE_INNOVATION_MAP.get(role_key, ()))
         self.government = government
         self.innovation_manager = InnovationManager(government)
         self.commands: Dict[str, Callable[[Player], None]] = {
@@ -18,31 +20,47 @@ class RoleInterface:
         self.all_commands: Dict[str, str] = {
             "research": "Research a specific innovation"
         }
+        self._cmd_cache: Optional[Dict[str, str]] = None
+        self._cmd_cache_version = -1
+        self._dispatch_table: List[Tuple[str, str, Callable[[Player], bool]]] = []
 
     def get_commands(self) -> Dict[str, str]:
-        discovered = self.government.innovation_pool.discovered
-        return {
-            cmd_key: desc for cmd_key, desc in self.all_commands.items()
-            if CommandRegistry.is_command_available(cmd_key, discovered)
-        }
+        innovation_pool = self.government.innovation_pool
+        if self._cmd_cache is None or self._cmd_cache_version != innovation_pool.version:
+            discovered_mask = innovation_pool.discovered_mask
+            self._cmd_cache = {
+                cmd_key: desc for cmd_key, desc in self.all_commands.items()
+                if CommandRegistry.is_command_available(cmd_key, discovered_mask)
+            }
+            self._cmd_cache_version = innovation_pool.version
+            self._dispatch_table = [
+                (cmd_key, desc, partial(self.execute_command, cmd_key)) for cmd_key, desc in self._cmd_cache.items()
+            ]
+        return self._cmd_cache
+
+    def get_dispatch_table(self) -> List[Tuple[str, str, Callable[[Player], bool]]]:
+        """Available commands as (key, description, action taking the acting player), rebuilt with get_commands."""
+        self.get_commands()
+        return self._dispatch_table
 
     def execute_command(self, command_key: str, player: Player) -> bool:
-        if command_key in self.get_commands():
+        available = self.get_commands()
+        if command_key in available:
             self.commands[command_key](player)
             return True
         Messages.add(f"Command '{command_key}' is not available yet.")
         logger.info(f"Command '{command_key}' not available")
         return False
 
-    def get_role_innovations(self) -> List['core.innovation.Innovation']:
-        return ROLE_INNOVATION_MAP.get(self.role_key, [])
+    def get_role_innovations(self) -> Tuple['innovations.innovation.Innovation', ...]:
+        return self._role_innovations
 
     def research(self, player: Player) -> None:
+        discovered = self.government.innovation_pool.discovered
+        queued = self.government.research_queue_set
         available_innovations = [
             innov for innov in self.get_role_innovations()
-            if innov.name not in self.government.innovation_pool.discovered and
-               innov.name not in self.government.research_queue and
-               innov.is_discoverable(self.government.innovation_pool.discovered)
+            if innov.name not in discovered and innov.name not in queued and innov.is_discoverable(discovered)
         ]
         if not available_innovations:
             Messages.add("No innovations available to research.")
@@ -83,9 +101,10 @@ class LeadershipInterface(RoleInterface):
         })
 
     def start_nominations(self, player: Player) -> None:
+        command_based_votes = self.government.sim.voting_manager.command_based_votes
         eligible_votes = [
-            vote for vote in self.government.sim.voting_manager.active_votes
-            if vote.nomination_control == "command_based" and vote.can_start_nominations(player) and not vote.is_nomination_open
+            vote for vote in command_based_votes
+            if not vote.is_nomination_open and vote.can_start_nominations(player)
         ]
         if not eligible_votes:
             print("No roles available to start nominations for.")
@@ -104,9 +123,10 @@ class LeadershipInterface(RoleInterface):
         input("Press Enter to continue...")
 
     def close_nominations(self, player: Player) -> None:
+        command_based_votes = self.government.sim.voting_manager.command_based_votes
         eligible_votes = [
-            vote for vote in self.government.sim.voting_manager.active_votes
-            if vote.nomination_control == "command_based" and vote.can_close_nominations(player) and vote.is_nomination_open
+            vote for vote in command_based_votes
+            if vote.is_nomination_open and vote.can_close_nominations(player)
         ]
         if not eligible_votes:
             print("No roles available to close nominations for.")
@@ -128,8 +148,7 @@ class LeadershipInterface(RoleInterface):
         players = self.government.players
         selected_player = choose_from_list(players, "Select player to remove role from:", lambda p: p.name)
         if selected_player:
-            titled_roles_held = [role for role, holders in self.government.assignments.items() if
-                                 selected_player in holders]
+            titled_roles_held = self.government.get_player_titles(selected_player)
             if not titled_roles_held:
                 print(f"{selected_player.name} has no titled roles.")
                 logger.info(f"{selected_player.name} has no titled roles")
@@ -193,11 +212,7 @@ class MilitaryInterface(RoleInterface):
         })
 
     def appoint_player_to_role(self, player: Player) -> None:
-        appointable_roles = [
-            role_id for role_id, reqs in self.government.government_type.title_requirements.items()
-            if reqs.get("selection_method") == "appointment" and player in self.government.get_role_holders(
-                reqs.get("appointer"))
-        ]
+        appointable_roles = self.government.get_appointable_roles(player)
         if not appointable_roles:
             print("No roles available to appoint.")
             logger.info("No roles available to appoint")
@@ -302,7 +317,7 @@ class CivicRepresentationInterface(RoleInterface):
             "represent_people": "Represent the people’s interests"
         })
         self.commands.update({
-            "represent_people": "self.represent_people"
+            "represent_people": self.represent_people
         })
 
     def represent_people(self, player: Player) -> None:
@@ -312,17 +327,25 @@ class CivicRepresentationInterface(RoleInterface):
         input("Press Enter to continue...")
 
 ROLE_INTERFACES: Dict[str, RoleInterface] = {}
+_INIT_FOR: Optional[int] = None  # id() of the Government ROLE_INTERFACES was built for
 
 def initialize_interfaces(government: 'core.government.Government') -> None:
-    """Initialize the role interfaces registry with a Government instance."""
+    """Initialize the role interfaces registry with a Government instance. Repeat calls for it are no-ops."""
+    global _INIT_FOR
+    if _INIT_FOR == id(government):
+        return
     from core.roles_config import ROLE_CONFIGS
-    global ROLE_CONFIGS
     logger.debug("Initializing role interfaces")
     ROLE_INTERFACES.update({
         config.key: config.interface_class(government)
         for config in ROLE_CONFIGS.values()
             if config.interface_class
     })
+    for interface in ROLE_INTERFACES.values():
+        # Stripped under -O; catches commands registered as something other than a bound method
+        assert all(callable(action) for action in interface.commands.values()), \
+            f"Non-callable command registered on {type(interface).__name__}"
+    _INIT_FOR = id(government)
 
 def get_interface(role_key: str) -> Optional['RoleInterface']:
     return ROLE_INTERFACES.get(role_key)
\ No newline at end of file
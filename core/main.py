@@ -1,80 +1,109 @@
+import logging
 import os
 import random
+import sys
 from typing import List, Tuple, Callable
 from core.government import Government
-from world.player import players, Player
+from world.player import players, Player, get_player_by_name
 from core.interfaces import initialize_interfaces
 from core.commands import CommandHandler
 from core.voting_manager import VotingManager
 from core.prompt import PromptManager
 from innovations.innovation_manager import InnovationManager
 from utils.messages import Messages
+from utils.ansi import CLEAR_SEQUENCE, RED, RESET
 from utils.logging_config import logger
 
+
+def _enable_ansi_clear() -> bool:
+    """Make sure the terminal understands ANSI escapes; Windows consoles need VT processing switched on first."""
+    if os.name != "nt":
+        return True
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))  # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+    except (AttributeError, OSError):
+        return False
+
 class Simulation:
     def __init__(self):
         self.government = Government(self)
         self.current_year = 0
         self.current_player_index = 0
         self.players = players
-        logger.debug(f"Players loaded: {[p.name for p in self.players]}")
+        self.current_player = self.players[self.current_player_index]
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Players loaded: %s", [p.name for p in self.players])
         self.running = True
         self.active_interface = None
+        self.ansi_clear = _enable_ansi_clear()
         self.command_handler = CommandHandler(self)
         self.voting_manager = VotingManager(self)
         self.innovation_manager = InnovationManager(self.government)
         for player in self.players:
             self.government.add_player(player)
-        logger.debug(f"Players added to government: {len(self.players)}")
+        logger.debug("Players added to government: %d", len(self.players))
         self.government.initialize()
         logger.debug("Government initialized")
         initialize_interfaces(self.government)
-        logger.debug(f"Initial discovered innovations: {self.government.innovation_pool.discovered}")
-        logger.debug(f"Initial assignments: {self.government.assignments}")
-        logger.debug(f"Government type: {self.government.government_type.name}")
-        for player in self.players:
-            logger.debug(f"{player.name}.assigned_roles: {player.assigned_roles}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Initial discovered innovations: %s", self.government.innovation_pool.discovered)
+            logger.debug("Initial assignments: %s", self.government.assignments)
+            logger.debug("Government type: %s", self.government.government_type.name)
+            for player in self.players:
+                logger.debug("%s.assigned_roles: %s", player.name, player.assigned_roles)
+
+    def get_player_by_name(self, name: str) -> Player:
+        """Look up a player through the roster's name index."""
+        return get_player_by_name(name)
 
     def clear_screen(self):
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if self.ansi_clear:
+            sys.stdout.write(CLEAR_SEQUENCE)
+            sys.stdout.flush()
+        else:
+            os.system('cls')
 
     def do_end_turn(self):
         """Advance the turn, process year-end events, and trigger managers."""
-        current_player = self.players[self.current_player_index]
-        logger.debug(f"Ending turn for {current_player.name}")
+        current_player = self.current_player
+        logger.debug("Ending turn for %s", current_player.name)
         for vote in self.voting_manager.active_votes:
             if vote.is_voting_active() and vote.force_vote and not vote.can_end_turn(current_player):
                 Messages.add(f"You must vote for {vote.role} before ending your turn!")
                 return
         self.active_interface = None
         roll, _ = self.government.dice_bag.roll("d20")
-        logger.debug(f"Divine appointment roll: {roll}")
+        logger.debug("Divine appointment roll: %d", roll)
         if roll == 20:
-            assigned_players = set()
-            for holders in self.government.assignments.values():
-                assigned_players.update(holders)
+            assigned_players = set().union(*self.government.assignments.values())
             unassigned_players = [p for p in self.players if p not in assigned_players]
             if unassigned_players:
                 available_roles = [
-                    role for role, reqs in self.government.government_type.title_requirements.items()
-                    if reqs.get("selection_method") == "divine_appointment" and
-                       len(self.government.assignments.get(role, [])) < reqs.get("max_holders", 1)
+                    role for role, max_holders in self.government.government_type.divine_appointment_roles
+                    if len(self.government.assignments.get(role, [])) < max_holders
                 ]
                 if available_roles:
                     selected_player = random.choice(unassigned_players)
                     selected_role = random.choice(available_roles)
                     if self.government.assign_role(selected_role, selected_player):
                         Messages.add(f"{selected_player.name} has been divinely appointed as {selected_role}")
-                        logger.debug(f"Divinely appointed {selected_player.name} as {selected_role}")
+                        logger.debug("Divinely appointed %s as %s", selected_player.name, selected_role)
         self.voting_manager.process_votes()  # Process votes before year advances
         self.current_player_index = (self.current_player_index + 1) % len(self.players)
+        self.current_player = self.players[self.current_player_index]
         if self.current_player_index == 0:
             self.current_year += 1
             self.government.generate_innovation_points()
             Messages.add(
                 f"Year {self.current_year} begins. Innovation Points: {self.government.innovation_pool.points}"
             )
-            logger.debug(f"New year {self.current_year}")
+            logger.debug("New year %d", self.current_year)
             self.voting_manager.process_votes()  # Process votes to close nominations and start voting
             self.innovation_manager.process_turn()
             self.voting_manager.initiate_votes()
@@ -87,32 +116,30 @@ class Simulation:
         Messages.add(f"Players: {[p.name for p in self.players]}")
         Messages.add(f"Initial Year: {self.current_year}")
         self.voting_manager.initiate_votes()
+        prompt = None
         while self.running:
             self.clear_screen()
-            prompt, menu_items = self.command_handler.get_prompt()
+            if prompt is None:
+                prompt, menu_items, dispatch_map = self.command_handler.get_prompt()
             command = input(prompt).strip().lower()
-            logger.debug(f"Received command: {command}")
-            try:
-                num = int(command)
-                for number, action, key in menu_items:
-                    if number == num:
-                        action()
-                        logger.debug(f"Executed action for command {key}")
-                        break
-                else:
-                    print("\033[91mInvalid selection.\033[0m")
-                    logger.info("Invalid selection entered")
-                    input("Press Enter to continue...")
-            except ValueError:
-                for number, action, key in menu_items:
-                    if command == key:
-                        action()
-                        logger.debug(f"Executed action for command {key}")
-                        break
-                else:
-                    print("\033[91mUnknown command.\033[0m")
-                    logger.info("Unknown command entered")
-                    input("Press Enter to continue...")
+            logger.debug("Received command: %s", command)
+            action = dispatch_map.get(command)
+            if action:
+                action()
+                logger.debug("Executed action for command %s", command)
+            elif command.isdigit():
+                print(f"{RED}Invalid selection.{RESET}")
+                logger.info("Invalid selection entered")
+                input("Press Enter to continue...")
+            else:
+                print(f"{RED}Unknown command.{RESET}")
+                logger.info("Unknown command entered")
+                input("Press Enter to continue...")
+            # Informational commands and bad input change nothing; redraw the same menu unless messages were queued
+            if (action is None or action in self.command_handler.read_only_actions) and Messages.is_empty():
+                prompt = self.command_handler.prompt_manager.quiet_prompt or None
+            else:
+                prompt = None
 
 if __name__ == "__main__":
     sim = Simulation()
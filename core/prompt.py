@@ -1,13 +1,33 @@
-from typing import List, Tuple, Callable
+import logging
+from functools import partial
+from typing import Dict, List, Tuple, Callable
 from world.player import Player
 from utils.utils import choose_from_list
 from utils.logging_config import logger
 from utils.messages import Messages
+from utils.ansi import CYAN, RESET, SEP
+
+
+def build_dispatch_map(menu_items: List[Tuple[int, Callable[[], None], str]]) -> Dict[str, Callable[[], None]]:
+    """Map each menu number (as typed) and command key to its action. Numbers win over keys; the first key wins."""
+    dispatch = {key: action for _, action, key in reversed(menu_items)}
+    dispatch.update((str(number), action) for number, action, _ in menu_items)
+    return dispatch
 
 
 class PromptManager:
     def __init__(self, simulation: 'core.main.Simulation'):
         self.sim = simulation
+        self._interface_menu_cache = None  # (key, (menu text, menu items)) for the last interface render
+        self.quiet_prompt = ""  # Last prompt with an empty messages section, for redraws that change nothing
+        self._menu_predicates = None  # Predicate (or None) per general command, in menu order; built on first render
+        self._general_menu_cache: Dict[Tuple[bool, ...], Tuple[str, List[Tuple[int, Callable[[], None], str]], int]] = {}
+        # Commands shown only conditionally; each predicate takes (player, roles, can_appoint)
+        self._command_predicates: Dict[str, Callable[[Player, List[str], bool], bool]] = {
+            "open_role_interface": lambda player, roles, can_appoint: bool(roles),
+            "nominate": self._can_nominate,
+            "appoint_player_to_role": lambda player, roles, can_appoint: can_appoint,
+        }
 
     def get_prompt(self) -> Tuple[str, List[Tuple[int, Callable[[], None], str]]]:
         """
@@ -16,63 +36,63 @@ class PromptManager:
         """
         try:
             self.sim.voting_manager.initiate_votes()
-            current_player = self.sim.players[self.sim.current_player_index]
+            current_player = self.sim.current_player
+            roles = self._get_player_roles(current_player)
+
+            # Sort the active votes by phase once; the builders below only read these lists
+            active_votes = self.sim.voting_manager.active_votes
+            voting_votes = [vote for vote in active_votes if vote.voting_active]
+            campaign_votes = [vote for vote in active_votes if vote.is_nomination_open or vote.voting_active]
 
             # Build prompt components
             state_info = self._build_state_info()
-            campaign_info = self._build_campaign_info()
+            campaign_info = self._build_campaign_info(campaign_votes)
             messages = self._build_messages()
-            general_menu, menu_items, next_number = self._build_general_menu(current_player)
-            submenu, additional_menu_items = self._build_submenu(current_player, next_number)
+            general_menu, menu_items, next_number = self._build_general_menu(current_player, roles)
+            submenu, additional_menu_items = self._build_submenu(current_player, next_number, voting_votes)
 
             # Combine prompt
-            prompt = f"\n{messages}\n{state_info}{campaign_info}{general_menu}{submenu}\n{current_player.name} ({', '.join(self._get_player_roles(current_player))}) > "
+            body = f"{state_info}{campaign_info}{general_menu}{submenu}\n{current_player.name} ({', '.join(roles)}) > "
+            prompt = f"\n{messages}\n{body}"
+            self.quiet_prompt = f"\n\n{body}"
             menu_items.extend(additional_menu_items)
 
-            logger.debug(f"Final menu items: {[(n, k) for n, _, k in menu_items]}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Final menu items: %s", [(n, k) for n, _, k in menu_items])
             return prompt, menu_items
         except Exception as e:
             logger.error(f"Error generating prompt: {e}")
+            self.quiet_prompt = ""
             return "Error generating prompt. Please report this bug.\n", []
 
     def _get_player_roles(self, player: Player) -> List[str]:
         """Get the roles assigned to the current player."""
-        roles = [
-            role_key for role_key, holders in self.sim.government.assignments.items()
-            if player in holders
-        ]
-        return list(dict.fromkeys(roles)) or ["None"]
+        return self.sim.government.get_player_titles(player) or ["None"]
 
     def _build_state_info(self) -> str:
         """Build the state information section of the prompt."""
-        discovered = [i.name for i in self.sim.government.innovation_pool.get_discovered()]
+        government = self.sim.government
+        innovation_pool = government.innovation_pool
         return (
-            "__________________________________\n"
-            f"Year {self.sim.current_year} | Innovation Points: {self.sim.government.innovation_pool.points}\n"
-            f"Government Type: {self.sim.government.government_type.name}\n"
-            f"Discovered Innovations: {', '.join(discovered) or 'None'}\n"
-            f"Research Queue: {', '.join(self.sim.government.research_queue) or 'Empty'}\n"
-            "__________________________________\n"
+            f"{SEP}"
+            f"Year {self.sim.current_year} | Innovation Points: {innovation_pool.points}\n"
+            f"Government Type: {government.government_type.name}\n"
+            f"Discovered Innovations: {innovation_pool.discovered_names_str}\n"
+            f"Research Queue: {government.research_queue_str}\n"
+            f"{SEP}"
         )
 
-    def _build_campaign_info(self) -> str:
-        """Build the election campaigns section of the prompt."""
-        # Collect votes that are either in nomination or voting phase
-        active_campaigns = [
-            vote for vote in self.sim.voting_manager.active_votes
-            if vote.is_nomination_open or vote.voting_active
-        ]
+    def _build_campaign_info(self, active_campaigns: List['core.voting.VotingSystem']) -> str:
+        """Build the election campaigns section of the prompt from the votes in nomination or voting phase."""
         if not active_campaigns:
             return ""
 
         # Build the campaign box with ANSI color coding
-        campaign_info = "\033[96m__________________________________\nElection Campaigns:\n"
+        parts = [f"{CYAN}{SEP}Election Campaigns:\n"]
         for vote in active_campaigns:
-            # Get max_holders for the role to decide if seat number should be shown
-            max_holders = self.sim.government.government_type.title_requirements.get(vote.role, {}).get("max_holders",
-                                                                                                        1)
+            # Only multi-seat roles show the seat number
             role_str = vote.role
-            if max_holders > 1 and vote.seat_number is not None:
+            if vote.max_holders > 1 and vote.seat_number is not None:
                 role_str += f" (Seat {vote.seat_number})"
 
             # Determine the phase and list of names
@@ -86,11 +106,10 @@ class PromptManager:
                 continue  # Skip if neither phase is active (shouldn’t happen)
 
             # Add the formatted line
-            line = f"  {phase_str} {role_str}: {list_str}\n"
-            campaign_info += line
+            parts.append(f"  {phase_str} {role_str}: {list_str}\n")
 
-        campaign_info += "__________________________________\n\n\033[0m"
-        return campaign_info
+        parts.append(f"{SEP}\n{RESET}")
+        return "".join(parts)
 
     def _build_messages(self) -> str:
         """Build and clear the messages section."""
@@ -98,84 +117,95 @@ class PromptManager:
         Messages.clear()
         return msg_str
 
-    def _build_general_menu(self, current_player: Player) -> Tuple[str, List[Tuple[int, Callable[[], None], str]], int]:
+    def _build_general_menu(self, current_player: Player, roles: List[str]) -> Tuple[
+        str, List[Tuple[int, Callable[[], None], str]], int]:
         """Build the general commands menu, filtering unavailable commands. Returns menu string, items, and next number."""
-        menu_items = []
-        general_menu = "General Commands:\n"
-        number = 1
-        roles = self._get_player_roles(current_player)
-
-        for key, desc, action in self.sim.command_handler.commands:
-            if self._should_include_command(key, current_player, roles):
-                general_menu += f"  {number}: {desc}\n"
-                menu_items.append((number, action, key))
-                number += 1
-
-        return general_menu, menu_items, number
-
-    def _should_include_command(self, key: str, player: Player, roles: List[str]) -> bool:
-        """Determine if a command should be included in the menu."""
-        if key == "open_role_interface" and not roles:
-            return False
-        if key == "nominate":
-            return any(
-                vote.is_nomination_open and (
-                        vote.nomination_method == "open" or
-                        (vote.nomination_method == "self_appointed" and player.name not in [
-                            c.name if isinstance(c, Player) else c for c in vote.nominations[vote.role]
-                        ]) or
-                        (vote.nomination_method == "appointed" and vote.can_appoint(player, vote.role))
-                )
-                for vote in self.sim.voting_manager.active_votes
-            )
-        if key == "appoint_player_to_role":
-            return any(
-                reqs.get("selection_method") == "appointment" and
-                player in self.sim.government.get_role_holders(reqs.get("appointer"))
-                for role_id, reqs in self.sim.government.government_type.title_requirements.items()
-            )
-        return True
-
-    def _build_submenu(self, current_player: Player, start_number: int) -> Tuple[
+        commands = self.sim.command_handler.commands
+        can_appoint = bool(self.sim.government.get_appointable_roles(current_player))
+        if self._menu_predicates is None:
+            self._menu_predicates = tuple(self._command_predicates.get(key) for key, _, _ in commands)
+        # The menu depends only on which commands are shown, so cache the render per visibility pattern
+        visible = tuple(
+            predicate is None or predicate(current_player, roles, can_appoint) for predicate in self._menu_predicates
+        )
+        cached = self._general_menu_cache.get(visible)
+        if cached is None:
+            menu_items = []
+            parts = ["General Commands:\n"]
+            number = 1
+            for (key, desc, action), shown in zip(commands, visible):
+                if shown:
+                    parts.append(f"  {number}: {desc}\n")
+                    menu_items.append((number, action, key))
+                    number += 1
+            cached = self._general_menu_cache[visible] = ("".join(parts), menu_items, number)
+        general_menu, menu_items, number = cached
+        return general_menu, list(menu_items), number
+
+    def _can_nominate(self, player: Player, roles: List[str], can_appoint: bool) -> bool:
+        """Check if any vote taking nominations will accept one from the player."""
+        # Only votes taking nominations are indexed here; nominations hold candidate names
+        nominating_votes = self.sim.voting_manager.nominating_votes
+        return bool(nominating_votes.get("open")) or any(
+            player.name not in vote.nominated_names for vote in nominating_votes.get("self_appointed", ())
+        ) or any(
+            vote.can_appoint(player, vote.role) for vote in nominating_votes.get("appointed", ())
+        )
+
+    def _build_submenu(self, current_player: Player, start_number: int,
+                       voting_votes: List['core.voting.VotingSystem']) -> Tuple[
         str, List[Tuple[int, Callable[[], None], str]]]:
         """Build the voting and interface commands submenu, continuing the number sequence from start_number."""
-        submenu = ""
+        parts = []
         menu_items = []
         number = start_number
 
         # Voting Commands
-        voting_active = any(vote.is_voting_active() for vote in self.sim.voting_manager.active_votes)
-        logger.debug(
-            f"Active votes: {[f'{vote.role} (seat {vote.seat_number}, active={vote.is_voting_active()})' for vote in self.sim.voting_manager.active_votes]}")
-        logger.debug(f"Voting active: {voting_active}")
-
-        if voting_active:
-            submenu += "__________________________________\nVoting Commands:\n"
-            for vote in self.sim.voting_manager.active_votes:
-                if vote.is_voting_active() and current_player not in vote.votes:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Votes in voting phase: %s", [f"{vote.role} (seat {vote.seat_number})" for vote in voting_votes])
+
+        if voting_votes:
+            parts.append(f"{SEP}Voting Commands:\n")
+            for vote in voting_votes:
+                if current_player not in vote.votes:
                     interface = self.sim.voting_manager.vote_interfaces.get(vote.role)
-                    logger.debug(
-                        f"Vote {vote.role}: Interface={interface}, Player voted={current_player in vote.votes}")
+                    logger.debug("Vote %s: Interface=%s", vote.role, interface)
                     if interface:
-                        submenu += f"  {number}: {interface.display_vote_options()}\n"
+                        parts.append(f"  {number}: {interface.display_vote_options()}\n")
                         menu_items.append(
-                            (number, lambda r=vote.role: self.sim.voting_manager.handle_vote(r), vote.role)
+                            (number, partial(self.sim.voting_manager.handle_vote, vote.role), vote.role)
                         )
                         number += 1
 
         # Interface Commands
         if self.sim.active_interface:
-            submenu += "__________________________________\n"
-            submenu += f"{self.sim.active_interface.role_key.capitalize()} Interface Commands:\n"
-            role_commands = self.sim.active_interface.get_commands()
-            logger.debug(f"Role commands: {role_commands}")
-            for cmd_key, cmd_desc in role_commands.items():
-                action = lambda key=cmd_key: self.sim.active_interface.execute_command(key, current_player)
-                submenu += f"  {number}: {cmd_desc}\n"
-                menu_items.append((number, action, cmd_key))
-                logger.debug(f"Assigned {number} to {cmd_key}: {cmd_desc}")
-                number += 1
-            submenu += f"  {number}: Close interface\n"
-            menu_items.append((number, lambda: setattr(self.sim, 'active_interface', None), "close_interface"))
+            interface_menu, interface_items = self._build_interface_menu(current_player, number)
+            parts.append(interface_menu)
+            menu_items.extend(interface_items)
+
+        return "".join(parts), menu_items
 
+    def _build_interface_menu(self, current_player: Player, start_number: int) -> Tuple[
+        str, List[Tuple[int, Callable[[], None], str]]]:
+        """Build the active interface's command section, reusing the last render while its inputs are unchanged."""
+        active_interface = self.sim.active_interface
+        key = (active_interface, self.sim.government.innovation_pool.version, self.sim.current_player_index,
+               start_number)
+        if self._interface_menu_cache and self._interface_menu_cache[0] == key:
+            return self._interface_menu_cache[1]
+
+        parts = [SEP, f"{active_interface.role_key.capitalize()} Interface Commands:\n"]
+        menu_items = []
+        number = start_number
+        for cmd_key, cmd_desc, run_command in active_interface.get_dispatch_table():
+            action = partial(run_command, current_player)
+            parts.append(f"  {number}: {cmd_desc}\n")
+            menu_items.append((number, action, cmd_key))
+            logger.debug("Assigned %d to %s: %s", number, cmd_key, cmd_desc)
+            number += 1
+        parts.append(f"  {number}: Close interface\n")
+        menu_items.append((number, partial(setattr, self.sim, 'active_interface', None), "close_interface"))
+
+        submenu = "".join(parts)
+        self._interface_menu_cache = (key, (submenu, menu_items))
         return submenu, menu_items
\ No newline at end of file
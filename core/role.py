@@ -1,28 +1,26 @@
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional, List
 from core.roles_config import ROLE_CONFIGS
 
+@dataclass(frozen=True, slots=True)
 class Role:
-    def __init__(
-        self,
-        key: str,
-        name: str,
-        description: str,
-        interface_tag: str,
-        title: str = None,
-        selection_required: bool = True
-    ):
-        self.key = key
-        self.name = name
-        self.description = description
-        self.interface_tag = interface_tag
-        self.title = title or None
-        self.selection_required = selection_required
+    key: str
+    name: str
+    description: str
+    interface_tag: str
+    title: Optional[str] = None
+    selection_required: bool = True
+
+    def __post_init__(self):
+        object.__setattr__(self, "title", self.title or None)
 
     def __repr__(self):
         return f"<Role {self.name} (Key: {self.key})>"
 
+@lru_cache(maxsize=None)
 def get_role(key: str) -> Optional[Role]:
-    """Fetch a role by its key."""
+    """Fetch a role by its key. Roles are shared, read-only instances."""
     config = ROLE_CONFIGS.get(key)
     if not config:
         return None
@@ -36,4 +34,4 @@ def get_role(key: str) -> Optional[Role]:
 
 def get_unlocked_roles(owned_innovations: set[str]) -> List[Role]:
     """Get all roles, as they have no innovation requirements."""
-    return [get_role(key) for key in ROLE_CONFIGS if get_role(key)]
\ No newline at end of file
+    return [role for key in ROLE_CONFIGS if (role := get_role(key)) is not None]
\ No newline at end of file
@@ -1,5 +1,5 @@
 from typing import List, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 import json
 from core.interfaces import (
     LeadershipInterface,
@@ -13,7 +13,7 @@ from core.interfaces import (
     CivicRepresentationInterface
 )
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RoleConfig:
     key: str
     name: str
@@ -24,6 +24,9 @@ class RoleConfig:
     innovation_points: int
     interface_class: Optional['type[core.interfaces.RoleInterface]']
 
+# Fields written by save_configs_to_json; interface classes are not serializable
+_SERIALIZABLE_FIELDS = tuple(f.name for f in fields(RoleConfig) if f.name != "interface_class")
+
 def get_role_configs():
     """Define role configurations."""
     return {
@@ -134,10 +137,7 @@ validate_configs()
 def save_configs_to_json(filename: str):
     """Save ROLE_CONFIGS to a JSON file."""
     configs = {
-        key: {
-            k: v for k, v in asdict(config).items()
-            if k != 'interface_class'
-        }
+        key: {name: getattr(config, name) for name in _SERIALIZABLE_FIELDS}
         for key, config in ROLE_CONFIGS.items()
     }
     with open(filename, 'w') as f:
@@ -5,8 +5,11 @@ from core.government_types import GovernmentType
 from core.roles_config import ROLE_CONFIGS
 
 
+ROLE_LIMITS: Dict[str, int] = {config.key: config.max_holders for config in ROLE_CONFIGS.values()}
+
+
 def get_role_limits() -> Dict[str, int]:
-    return {config.key: config.max_holders for config in ROLE_CONFIGS.values()}
+    return ROLE_LIMITS
 
 
 def is_role_unlocked(role_id: str, discovered: Set[str]) -> Tuple[bool, List[str]]:
@@ -21,24 +24,19 @@ def can_assign_role(role_id: str, player: Player, assignments: Dict[str, List[Pl
     reasons = []
 
     if role_id in government_type.role_mappings:
-        title_reqs = government_type.title_requirements.get(role_id, {})
-        missing = [req for req in title_reqs.get("innovations", []) if req not in discovered]
+        title_reqs = government_type.get_title_requirements(role_id)
+        missing = [req for req in title_reqs.innovations if req not in discovered]
         if missing:
             reasons.append(f"Title '{role_id}' requires missing innovations: {', '.join(missing)}")
             return False, reasons
-        max_holders = title_reqs.get("max_holders", 1)
+        max_holders = title_reqs.max_holders
         current_holders = len(assignments.get(role_id, []))
         if current_holders >= max_holders:
             reasons.append(f"Maximum holders ({max_holders}) for '{role_id}' already reached")
             return False, reasons
-        any_valid = False
-        for base_role in government_type.role_mappings[role_id]:
-            unlocked, base_reasons = is_role_unlocked(base_role, discovered)
-            if unlocked:
-                any_valid = True
-            else:
-                reasons.extend(base_reasons)
-        if not any_valid:
+        valid_base_roles, invalid_base_roles = government_type.base_role_validity[role_id]
+        if not valid_base_roles:
+            reasons.extend(f"Key '{base_role}' does not exist" for base_role in invalid_base_roles)
             reasons.append(f"No base roles for '{role_id}' are valid")
             return False, reasons
         return True, []
@@ -47,8 +45,7 @@ def can_assign_role(role_id: str, player: Player, assignments: Dict[str, List[Pl
     if not unlocked:
         reasons.extend(base_reasons)
         return False, reasons
-    role_limits = get_role_limits()
-    max_holders = role_limits.get(role_id, 1)
+    max_holders = ROLE_LIMITS.get(role_id, 1)
     current_holders = len(assignments.get(role_id, []))
     if current_holders >= max_holders:
         reasons.append(f"Maximum holders ({max_holders}) for '{role_id}' already reached")
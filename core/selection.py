@@ -1,4 +1,4 @@
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, AbstractSet, Iterable
 
 class SelectionMethod:
     def __init__(
@@ -12,14 +12,14 @@ class SelectionMethod:
         self.key = key
         self.name = name
         self.description = description
-        self.required_innovations = required_innovations or []
+        self.required_innovations = frozenset(required_innovations or ())
         self.available_at_start = available_at_start  # Allow use at game start (e.g., tribal phase)
 
-    def is_unlocked(self, owned_innovations: List[str]) -> bool:
+    def is_unlocked(self, owned_innovations: AbstractSet[str]) -> bool:
         """Check if the selection method is unlocked based on innovations or initial availability."""
         if self.available_at_start:
             return True  # Available at game start (e.g., for tribal government)
-        return all(req in owned_innovations for req in self.required_innovations)
+        return self.required_innovations.issubset(owned_innovations)
 
     def __repr__(self):
         return f"<SelectionMethod {self.name} (Key: {self.key})>"
@@ -95,14 +95,15 @@ SELECTION_METHODS: Dict[str, SelectionMethod] = {
     )
 }
 
-def get_unlocked_selection_methods(owned_innovations: List[str], government_type: Optional[str] = None) -> List[SelectionMethod]:
+def get_unlocked_selection_methods(owned_innovations: Iterable[str], government_type: Optional[str] = None) -> List[SelectionMethod]:
     """
     Get unlocked selection methods based on current innovations and optional government type.
     government_type is a placeholder for future integration with government_types.py.
     """
+    owned = owned_innovations if isinstance(owned_innovations, (set, frozenset)) else set(owned_innovations)
     unlocked_methods = [
         method for method in SELECTION_METHODS.values()
-        if method.is_unlocked(owned_innovations)
+        if method.is_unlocked(owned)
     ]
     # Placeholder for government type filtering (to be expanded later)
     if government_type:
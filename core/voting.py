@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Set, Optional
+from typing import Dict, List, Set, Optional, Tuple, Type
 from world.player import Player
 from core.government import Government
 from utils.messages import Messages
@@ -7,6 +7,8 @@ import random
 from collections import defaultdict
 
 class VotingSystem(ABC):
+    interface_cls: Type['VotingInterface']  # Ballot interface for this system, bound below the interface classes
+
     def __init__(
         self,
         role: str,
@@ -18,6 +20,7 @@ class VotingSystem(ABC):
         seat_number: Optional[int] = None,
     ):
         self.seat_number = seat_number
+        self.max_holders = 1  # Seats for the role; set by the manager from the title requirements
         self.role = role
         self.force_vote = force_vote
         self.nomination_control = nomination_control  # "time_based" or "command_based"
@@ -26,10 +29,13 @@ class VotingSystem(ABC):
         self.nomination_closer_role = nomination_closer_role
         self.nomination_method = "open"
         self.government: Optional[Government] = None
+        self.manager: Optional['core.voting_manager.VotingManager'] = None
         self.nominations: Dict[str, List[str]] = {role: []}
-        self.votes: Dict[Player, str] = {}
+        self.nominated_names: Set[str] = set()  # Same names as nominations[role], for membership tests
+        self.votes: Dict[Player, int] = {}  # Player -> index into candidates; ranked choice overrides
         self.voting_active = False
         self.candidates: List[str] = []
+        self.candidate_index: Dict[str, int] = {}  # Candidate name -> position in candidates
         self.players: List[Player] = []
         self.is_nomination_open = False
         self.nomination_start_year: Optional[int] = None
@@ -37,6 +43,16 @@ class VotingSystem(ABC):
 
     def set_nomination_method(self, method: str):
         self.nomination_method = method
+        self._notify_nomination_change()
+
+    def _notify_nomination_change(self):
+        """Let the owning manager re-index this vote after a nomination state change."""
+        if self.manager:
+            self.manager.update_nomination_index(self)
+
+    def _mark_dirty(self):
+        if self.manager:
+            self.manager.mark_dirty()
 
     def start_nominations(self, current_year: int):
         """Start the nomination phase."""
@@ -47,6 +63,8 @@ class VotingSystem(ABC):
         self.is_nomination_open = True
         self.nomination_start_year = current_year
         self.nominations[self.role] = []
+        self.nominated_names = set()
+        self._notify_nomination_change()
 
     def close_nominations(self):
         """Close the nomination phase and prepare for voting or direct assignment."""
@@ -54,6 +72,7 @@ class VotingSystem(ABC):
             raise ValueError(f"Nominations for {self.role} are not open")
         self.is_nomination_open = False
         self.nomination_start_year = None
+        self._notify_nomination_change()
 
     def is_nomination_period_over(self, current_year: int) -> bool:
         """Check if the time-based nomination period has ended."""
@@ -72,36 +91,38 @@ class VotingSystem(ABC):
             raise ValueError("Only self-nomination is allowed")
         if self.nomination_method == "appointed" and not self.can_appoint(player, self.role):
             raise ValueError(f"{player.name} is not authorized to nominate for {self.role}")
-        if candidate_name in self.nominations[self.role]:
+        if candidate_name in self.nominated_names:
             raise ValueError(f"{candidate_name} is already nominated for {self.role}")
-        if candidate_name not in [p.name for p in self.government.players]:
+        if candidate_name not in self.government.player_names:
             raise ValueError(f"{candidate_name} is not a valid player")
         if self.government.is_player_assigned(candidate_name, self.role):
             raise ValueError(f"{candidate_name} is already assigned to {self.role}")
         self.nominations[self.role].append(candidate_name)
+        self.nominated_names.add(candidate_name)
+        self._mark_dirty()
 
     def can_start_nominations(self, player: Player) -> bool:
         """Check if a player can start nominations (for command-based)."""
         if self.nomination_control != "command_based" or not self.nomination_starter_role:
             return False
-        return player in self.government.assignments.get(self.nomination_starter_role, [])
+        return self.government.is_player_assigned(player.name, self.nomination_starter_role)
 
     def can_close_nominations(self, player: Player) -> bool:
         """Check if a player can close nominations (for command-based)."""
         if self.nomination_control != "command_based" or not self.nomination_closer_role:
             return False
-        return player in self.government.assignments.get(self.nomination_closer_role, [])
+        return self.government.is_player_assigned(player.name, self.nomination_closer_role)
 
     def can_appoint(self, player: Player, role: str) -> bool:
         """Check if a player can appoint nominees for a role."""
         if self.nomination_method != "appointed":
             return False
-        appointer = self.government.government_type.title_requirements.get(role, {}).get("appointer")
+        appointer = self.government.government_type.appointer_by_role.get(role)
         if appointer == "anyone":
             return True
         if not appointer:
             return False
-        return player in self.government.assignments.get(appointer, [])
+        return self.government.is_player_assigned(player.name, appointer)
 
     def can_end_turn(self, player: Player) -> bool:
         return not self.force_vote or player in self.votes
@@ -109,8 +130,17 @@ class VotingSystem(ABC):
     def start_vote(self, players: List[Player], candidates: List[str]):
         self.voting_active = True
         self.candidates = candidates
+        self.candidate_index = {candidate: i for i, candidate in enumerate(candidates)}
         self.players = players
         self.voting_start_year = self.government.sim.current_year  # Set voting start year
+        self._mark_dirty()
+
+    def _tally(self) -> List[int]:
+        """Count votes per candidate, in candidates order; single-choice systems store candidate indices."""
+        counts = [0] * len(self.candidates)
+        for index in self.votes.values():
+            counts[index] += 1
+        return counts
 
     def is_voting_active(self) -> bool:
         return self.voting_active
@@ -151,11 +181,11 @@ class FirstPastThePost(VotingSystem):
     def vote(self, player: Player, candidate: str):
         if not self.voting_active:
             raise ValueError("Voting is not active")
-        if candidate not in self.candidates:
+        if candidate not in self.candidate_index:
             raise ValueError(f"{candidate} is not a valid candidate")
         if player in self.votes:
             raise ValueError(f"{player.name} has already voted")
-        self.votes[player] = candidate
+        self.votes[player] = self.candidate_index[candidate]
 
     def is_complete(self, sim: 'core.main.Simulation') -> bool:
         # Voting completes when the year advances past the voting start year
@@ -164,11 +194,9 @@ class FirstPastThePost(VotingSystem):
     def get_result(self) -> str:
         if not self.votes:
             return random.choice(self.candidates)
-        vote_counts = {}
-        for candidate in self.candidates:
-            vote_counts[candidate] = sum(1 for v in self.votes.values() if v == candidate)
-        max_votes = max(vote_counts.values())
-        winners = [c for c, v in vote_counts.items() if v == max_votes]
+        counts = self._tally()
+        max_votes = max(counts)
+        winners = [c for c, n in zip(self.candidates, counts) if n == max_votes]
         return random.choice(winners)
 
 class RankedChoiceVoting(VotingSystem):
@@ -191,7 +219,7 @@ class RankedChoiceVoting(VotingSystem):
             nomination_closer_role,
             seat_number
         )
-        self.votes: Dict[Player, str] = {}
+        self.votes: Dict[Player, Tuple[int, ...]] = {}  # Player -> candidate indices in preference order
 
     def vote(self, player: Player, preferences: List[str]):
         if not self.voting_active:
@@ -202,30 +230,43 @@ class RankedChoiceVoting(VotingSystem):
             raise ValueError("Preferences must include all candidates")
         if player in self.votes:
             raise ValueError(f"{player.name} has already voted")
-        self.votes[player] = ",".join(preferences)
+        self.votes[player] = tuple(self.candidate_index[candidate] for candidate in preferences)
 
     def is_complete(self) -> bool:
         return len(self.votes) == len(self.players) or (not self.force_vote and len(self.votes) > 0)
 
     def get_result(self) -> str:
-        vote_counts = defaultdict(int)
-        eliminated = set()
-        preferences = {p: v.split(",") for p, v in self.votes.items()}
+        preferences = list(self.votes.values())
+        cursors = [0] * len(preferences)  # Position of each voter's top remaining choice
+        supporters = defaultdict(list)  # Candidate -> indices of voters whose top remaining choice it is
+        for i, prefs in enumerate(preferences):
+            supporters[prefs[0]].append(i)
+        total = len(preferences)
+        eliminated = [False] * len(self.candidates)
         while True:
-            vote_counts.clear()
-            for player, prefs in preferences.items():
-                for candidate in prefs:
-                    if candidate not in eliminated:
-                        vote_counts[candidate] += 1
-                        break
-            if not vote_counts:
+            if not supporters:
                 return random.choice(self.candidates)
-            max_votes = max(vote_counts.values())
-            if max_votes > sum(vote_counts.values()) / 2:
-                return max(vote_counts, key=vote_counts.get)
-            min_votes = min(vote_counts.values())
-            min_candidates = [c for c, v in vote_counts.items() if v == min_votes]
-            eliminated.add(random.choice(min_candidates))
+            leader = max(supporters, key=lambda c: len(supporters[c]))
+            if len(supporters[leader]) > total / 2:
+                return self.candidates[leader]
+            min_votes = min(len(v) for v in supporters.values())
+            # Order ties by each candidate's first supporter, as a full recount over the voters would
+            min_candidates = sorted(
+                (c for c, v in supporters.items() if len(v) == min_votes), key=lambda c: min(supporters[c])
+            )
+            loser = random.choice(min_candidates)
+            eliminated[loser] = True
+            # Only the loser's supporters move on to their next remaining choice
+            for i in supporters.pop(loser):
+                prefs = preferences[i]
+                cursor = cursors[i] + 1
+                while cursor < len(prefs) and eliminated[prefs[cursor]]:
+                    cursor += 1
+                cursors[i] = cursor
+                if cursor < len(prefs):
+                    supporters[prefs[cursor]].append(i)
+                else:
+                    total -= 1
 
 class TwoRoundRunoffVoting(VotingSystem):
     def __init__(
@@ -248,16 +289,17 @@ class TwoRoundRunoffVoting(VotingSystem):
             seat_number
         )
         self.finalists: List[str] = []
+        self._finalist_set: Set[str] = set()
         self.first_round = True
 
     def vote(self, player: Player, candidate: str):
         if not self.voting_active:
             raise ValueError("Voting is not active")
-        if candidate not in (self.finalists or self.candidates):
+        if candidate not in (self._finalist_set if self.finalists else self.candidate_index):
             raise ValueError(f"{candidate} is not a valid candidate")
         if player in self.votes:
             raise ValueError(f"{player.name} has already voted")
-        self.votes[player] = candidate
+        self.votes[player] = self.candidate_index[candidate]
 
     def is_complete(self) -> bool:
         return len(self.votes) == len(self.players) or (not self.force_vote and len(self.votes) > 0)
@@ -265,15 +307,17 @@ class TwoRoundRunoffVoting(VotingSystem):
     def get_result(self) -> str:
         if not self.votes:
             return random.choice(self.finalists or self.candidates)
-        vote_counts = {}
-        for candidate in (self.finalists or self.candidates):
-            vote_counts[candidate] = sum(1 for v in self.votes.values() if v == candidate)
+        counts = self._tally()
+        vote_counts = {
+            candidate: counts[self.candidate_index[candidate]] for candidate in (self.finalists or self.candidates)
+        }
         max_votes = max(vote_counts.values())
         if max_votes > sum(vote_counts.values()) / 2:
             return max(vote_counts, key=vote_counts.get)
         if not self.finalists:
             top_two = sorted(vote_counts, key=vote_counts.get, reverse=True)[:2]
             self.finalists = top_two
+            self._finalist_set = set(top_two)
             self.first_round = False
             self.votes.clear()
             return "RUNOFF"
@@ -313,4 +357,8 @@ class TwoRoundRunoffInterface(VotingInterface):
         return f"Vote for one: {', '.join(candidates)}"
 
     def handle_vote(self, player: Player, vote_data: str):
-        self.voting_system.vote(player, vote_data)
\ No newline at end of file
+        self.voting_system.vote(player, vote_data)
+
+FirstPastThePost.interface_cls = FirstPastThePostInterface
+RankedChoiceVoting.interface_cls = RankedChoiceInterface
+TwoRoundRunoffVoting.interface_cls = TwoRoundRunoffInterface
\ No newline at end of file
@@ -1,50 +1,118 @@
-from typing import List, Dict
-from core.voting import VotingSystem, FirstPastThePost, RankedChoiceVoting, TwoRoundRunoffVoting, VotingInterface, FirstPastThePostInterface, RankedChoiceInterface, TwoRoundRunoffInterface
+from collections import deque
+from itertools import islice
+from typing import Deque, List, Dict, Optional, Set, Tuple
+from core.voting import VotingSystem, FirstPastThePost, RankedChoiceVoting, TwoRoundRunoffVoting, VotingInterface
 from utils.messages import Messages
 from utils.logging_config import logger
 
+VOTING_SYSTEMS = {
+    "first_past_the_post": FirstPastThePost,
+    "ranked_choice": RankedChoiceVoting,
+    "two_round_runoff": TwoRoundRunoffVoting
+}
+
 class VotingManager:
     def __init__(self, simulation: 'core.main.Simulation'):
         self.sim = simulation
         self.active_votes: List[VotingSystem] = []
         self.vote_interfaces: Dict[str, VotingInterface] = {}
-        self.queued_seats: Dict[str, List[int]] = {}  # Role -> List of seat numbers to fill
+        self.queued_seats: Dict[str, Deque[int]] = {}  # Role -> seat numbers to fill, next first
+        self.nominating_votes: Dict[str, List[VotingSystem]] = {}  # Nomination method -> votes taking nominations
+        self.command_based_votes: List[VotingSystem] = []  # Active votes whose nominations are opened/closed by command
+        self._votes_by_role: Dict[str, List[VotingSystem]] = {}  # Role -> its active votes
+        self._open_nomination_roles: Set[str] = set()  # Roles with an active vote taking nominations
+        self._dirty = True  # Vote state changed since the last process_votes pass
+        self._processed_year: Optional[int] = None
+        self._votes_version = 0  # Bumped when votes are added/removed or their nominations open/close
+        self._initiated_state: Optional[Tuple] = None  # State initiate_votes last left behind
+
+    def mark_dirty(self):
+        """Record a vote state change so the next process_votes pass is not skipped."""
+        self._dirty = True
+
+    def add_vote(self, vote: VotingSystem):
+        """Track a new active vote."""
+        self.active_votes.append(vote)
+        self._votes_by_role.setdefault(vote.role, []).append(vote)
+        self._votes_version += 1
+        self._dirty = True
+        if vote.nomination_control == "command_based":
+            self.command_based_votes.append(vote)
+
+    def remove_vote(self, vote: VotingSystem):
+        """Stop tracking an active vote."""
+        self.remove_votes([vote])
+
+    def remove_votes(self, votes: List[VotingSystem]):
+        """Stop tracking several active votes, compacting each index once."""
+        removed = set(votes)
+        self.active_votes[:] = [v for v in self.active_votes if v not in removed]
+        self.command_based_votes[:] = [v for v in self.command_based_votes if v not in removed]
+        for role in {vote.role for vote in removed}:
+            role_votes = [v for v in self._votes_by_role.get(role, ()) if v not in removed]
+            if role_votes:
+                self._votes_by_role[role] = role_votes
+            else:
+                self._votes_by_role.pop(role, None)
+            self._update_open_nomination_role(role)
+        self._votes_version += 1
+        self._dirty = True
+
+    def _update_open_nomination_role(self, role: str):
+        if any(v.is_nomination_open for v in self._votes_by_role.get(role, ())):
+            self._open_nomination_roles.add(role)
+        else:
+            self._open_nomination_roles.discard(role)
+
+    def update_nomination_index(self, vote: VotingSystem):
+        """File a vote under its nomination method while its nominations are open."""
+        self._votes_version += 1
+        self._dirty = True
+        for votes in self.nominating_votes.values():
+            if vote in votes:
+                votes.remove(vote)
+        if vote.is_nomination_open:
+            self.nominating_votes.setdefault(vote.nomination_method, []).append(vote)
+        self._update_open_nomination_role(vote.role)
+
+    def _initiate_state(self) -> Tuple:
+        """Everything initiate_votes depends on: discoveries, assignments, government type and active votes."""
+        government = self.sim.government
+        return (government.innovation_pool.version, government.assignments_version, government.government_type,
+                self._votes_version)
 
     def initiate_votes(self):
-        """Initialize votes for vacant roles, queuing seats sequentially."""
-        logger.debug(f"Initiating votes. Current assignments: {self.sim.government.assignments}")
-        VOTING_SYSTEMS = {
-            "first_past_the_post": FirstPastThePost,
-            "ranked_choice": RankedChoiceVoting,
-            "two_round_runoff": TwoRoundRunoffVoting
-        }
+        """Initialize votes for vacant roles, queuing seats sequentially. Skipped when nothing has changed."""
+        if self._initiate_state() == self._initiated_state:
+            logger.debug("No discovery, assignment or vote changes since last call; skipping vote initiation")
+            return
+        logger.debug("Initiating votes. Current assignments: %s", self.sim.government.assignments)
         discovered = self.sim.government.innovation_pool.discovered
-        for role, reqs in self.sim.government.government_type.title_requirements.items():
-            selection_method = reqs.get("selection_method")
-            max_holders = reqs.get("max_holders", 1)
+        for role, reqs, required_innovations in self.sim.government.government_type.voting_roles:
+            max_holders = reqs.max_holders
             current_holders = len(self.sim.government.assignments.get(role, []))
-            active_votes_for_role = sum(1 for v in self.active_votes if v.role == role)
+            active_votes_for_role = len(self._votes_by_role.get(role, ()))
             vacant_seats = max_holders - current_holders - active_votes_for_role
-            required_innovations = set(reqs.get("innovations", []))
-            logger.debug(f"Checking role {role}: selection_method={selection_method}, "
-                         f"current_holders={current_holders}, max_holders={max_holders}, "
-                         f"active_votes={active_votes_for_role}, vacant_seats={vacant_seats}, "
-                         f"innovations={required_innovations}, discovered={discovered}")
-            if selection_method == "voting" and vacant_seats > 0 and required_innovations.issubset(discovered):
-                # Queue all vacant seats
-                self.queued_seats.setdefault(role, []).extend(
-                    range(current_holders + active_votes_for_role + 1, max_holders + 1))
+            logger.debug("Checking role %s: current_holders=%d, max_holders=%d, active_votes=%d, vacant_seats=%d, "
+                         "innovations=%s", role, current_holders, max_holders, active_votes_for_role, vacant_seats,
+                         required_innovations)
+            if vacant_seats > 0 and required_innovations.issubset(discovered):
+                # Top the queue up to one entry per vacant seat, so repeated calls leave it unchanged
+                queue = self.queued_seats.setdefault(role, deque())
+                need = vacant_seats - len(queue)
+                if need > 0:
+                    taken = set(queue).union(v.seat_number for v in self._votes_by_role.get(role, ()))
+                    queue.extend(islice((seat for seat in range(1, max_holders + 1) if seat not in taken), need))
                 # Start nominations for the first queued seat, if any
-                if self.queued_seats[role] and not any(
-                        v.role == role and v.is_nomination_open for v in self.active_votes):
-                    seat = self.queued_seats[role].pop(0)
-                    nomination_method = reqs.get("nomination_method", "open")
-                    voting_system_name = reqs.get("voting_system", "first_past_the_post")
-                    force_vote = reqs.get("force_vote", False)
-                    nomination_control = reqs.get("nomination_control", "time_based")
-                    nomination_duration = reqs.get("nomination_duration", 1)  # Added to define nomination_duration
-                    nomination_starter_role = reqs.get("nomination_starter_role")
-                    nomination_closer_role = reqs.get("nomination_closer_role")
+                if self.queued_seats[role] and role not in self._open_nomination_roles:
+                    seat = self.queued_seats[role].popleft()
+                    nomination_method = reqs.nomination_method
+                    voting_system_name = reqs.voting_system
+                    force_vote = reqs.force_vote
+                    nomination_control = reqs.nomination_control
+                    nomination_duration = reqs.nomination_duration
+                    nomination_starter_role = reqs.nomination_starter_role
+                    nomination_closer_role = reqs.nomination_closer_role
                     vote = VOTING_SYSTEMS[voting_system_name](
                         role,
                         force_vote,
@@ -55,94 +123,106 @@ class VotingManager:
                         seat_number=seat
                     )
                     vote.government = self.sim.government
+                    vote.manager = self
+                    vote.max_holders = max_holders
                     vote.set_nomination_method(nomination_method)
-                    self.active_votes.append(vote)
+                    self.add_vote(vote)
                     if nomination_control == "time_based":
                         vote.start_nominations(self.sim.current_year)
-                        logger.debug(f"Started time-based nominations for {role} (seat {seat})")
+                        logger.debug("Started time-based nominations for %s (seat %s)", role, seat)
                     else:
-                        logger.debug(f"Queued command-based nominations for {role} (seat {seat})")
+                        logger.debug("Queued command-based nominations for %s (seat %s)", role, seat)
             else:
-                if selection_method != "voting":
-                    logger.debug(f"Skipping {role}: selection_method is {selection_method}")
-                elif current_holders >= max_holders:
-                    logger.debug(f"Skipping {role}: already has enough holders")
+                if current_holders >= max_holders:
+                    logger.debug("Skipping %s: already has enough holders", role)
                 elif not required_innovations.issubset(discovered):
-                    logger.debug(f"Skipping {role}: required innovations not discovered")
+                    logger.debug("Skipping %s: required innovations not discovered", role)
+        self._initiated_state = self._initiate_state()
 
     def start_vote(self, role: str, voting_system: VotingSystem):
         """Start the voting phase for a role."""
-        self.vote_interfaces[role] = {
-            FirstPastThePost: FirstPastThePostInterface,
-            RankedChoiceVoting: RankedChoiceInterface,
-            TwoRoundRunoffVoting: TwoRoundRunoffInterface
-        }[type(voting_system)](voting_system)
-        logger.debug(f"Started voting for {role} with candidates {voting_system.candidates}")
+        self.vote_interfaces[role] = voting_system.interface_cls(voting_system)
+        logger.debug("Started voting for %s with candidates %s", role, voting_system.candidates)
         Messages.add(f"Voting started for {role} with candidates {voting_system.candidates}")
 
     def process_votes(self):
-        """Process active votes and nomination phases."""
-        logger.debug(f"Processing votes in year {self.sim.current_year}, player index {self.sim.current_player_index}")
-        for vote in self.active_votes[:]:
+        """Process active votes and nomination phases. Skipped when nothing has changed since the last pass."""
+        if not self._dirty and self._processed_year == self.sim.current_year:
+            logger.debug("No vote changes since last pass; skipping vote processing")
+            return
+        current_year = self.sim.current_year
+        self._dirty = False
+        self._processed_year = current_year
+        logger.debug("Processing votes in year %s, player index %s", current_year, self.sim.current_player_index)
+        players = self.sim.players
+        get_player = self.sim.get_player_by_name
+        government = self.sim.government
+        finished: List[VotingSystem] = []  # Removed in one pass after the loop
+        needs_reinit = False  # Refill queued seats once, after the finished votes are gone
+        for vote in self.active_votes:
+            role = vote.role
+            seat = vote.seat_number
             if vote.is_nomination_open:
-                if vote.nomination_control == "time_based" and vote.is_nomination_period_over(self.sim.current_year):
+                if vote.nomination_control == "time_based" and vote.is_nomination_period_over(current_year):
                     vote.close_nominations()
-                    logger.debug(f"Closed time-based nominations for {vote.role} (seat {vote.seat_number})")
+                    logger.debug("Closed time-based nominations for %s (seat %s)", role, seat)
             if not vote.is_nomination_open and not vote.is_voting_active():
-                candidates = vote.nominations[vote.role]
+                candidates = vote.nominations[role]
                 if len(candidates) == 1:
                     winner_name = candidates[0]
-                    winner = next(p for p in self.sim.players if p.name == winner_name)
-                    if self.sim.government.assign_role(vote.role, winner):
+                    winner = get_player(winner_name)
+                    if government.assign_role(role, winner):
                         Messages.add(
-                            f"{winner.name} elected as {vote.role} (seat {vote.seat_number}, single candidate)")
+                            f"{winner.name} elected as {role} (seat {seat}, single candidate)")
                         logger.debug(
-                            f"Elected {winner.name} as {vote.role} (seat {vote.seat_number}, single candidate)")
+                            "Elected %s as %s (seat %s, single candidate)", winner.name, role, seat)
                     else:
                         Messages.add(
-                            f"Failed to assign {winner.name} as {vote.role} (seat {vote.seat_number}); restarting nominations")
-                        logger.warning(f"Assignment failed for {winner.name} as {vote.role} seat {vote.seat_number}")
-                        self.queued_seats.setdefault(vote.role, []).insert(0, vote.seat_number)
-                    self.active_votes.remove(vote)
-                    if vote.role in self.vote_interfaces:
-                        del self.vote_interfaces[vote.role]
-                    if self.queued_seats.get(vote.role):
-                        self.initiate_votes()
+                            f"Failed to assign {winner.name} as {role} (seat {seat}); restarting nominations")
+                        logger.warning(f"Assignment failed for {winner.name} as {role} seat {seat}")
+                        self.queued_seats.setdefault(role, deque()).appendleft(seat)
+                    finished.append(vote)
+                    self.vote_interfaces.pop(role, None)
+                    if self.queued_seats.get(role):
+                        needs_reinit = True
                 elif len(candidates) > 1:
-                    vote.start_vote(self.sim.players, candidates)
-                    self.start_vote(vote.role, vote)
+                    vote.start_vote(players, candidates)
+                    self.start_vote(role, vote)
                     logger.debug(
-                        f"Started voting for {vote.role} (seat {vote.seat_number}) with candidates {vote.candidates}")
+                        "Started voting for %s (seat %s) with candidates %s", role, seat, vote.candidates)
                 elif len(candidates) == 0:
-                    self.active_votes.remove(vote)
-                    if vote.role in self.vote_interfaces:
-                        del self.vote_interfaces[vote.role]
-                    self.queued_seats.setdefault(vote.role, []).insert(0, vote.seat_number)
-                    self.initiate_votes()
-                    logger.debug(f"No candidates for {vote.role} (seat {vote.seat_number}), restarting nominations")
+                    finished.append(vote)
+                    self.vote_interfaces.pop(role, None)
+                    self.queued_seats.setdefault(role, deque()).appendleft(seat)
+                    needs_reinit = True
+                    logger.debug("No candidates for %s (seat %s), restarting nominations", role, seat)
             if vote.is_voting_active() and vote.is_complete(self.sim):
                 if isinstance(vote, TwoRoundRunoffVoting) and vote.get_result() == "RUNOFF":
-                    vote.start_vote(self.sim.players, vote.finalists)
+                    vote.start_vote(players, vote.finalists)
                     Messages.add(
-                        f"Runoff voting started for {vote.role} (seat {vote.seat_number}) between {', '.join(vote.finalists)}")
+                        f"Runoff voting started for {role} (seat {seat}) between {', '.join(vote.finalists)}")
                     logger.debug(
-                        f"Started runoff voting for {vote.role} (seat {vote.seat_number}) with finalists {vote.finalists}")
+                        "Started runoff voting for %s (seat %s) with finalists %s",
+                        role, seat, vote.finalists)
                     continue
                 winner_name = vote.get_result()
-                winner = next(p for p in self.sim.players if p.name == winner_name)
-                if self.sim.government.assign_role(vote.role, winner):
-                    Messages.add(f"{winner.name} has been elected as {vote.role} (seat {vote.seat_number})")
-                    logger.debug(f"Elected {winner.name} as {vote.role} (seat {vote.seat_number})")
+                winner = get_player(winner_name)
+                if government.assign_role(role, winner):
+                    Messages.add(f"{winner.name} has been elected as {role} (seat {seat})")
+                    logger.debug("Elected %s as %s (seat %s)", winner.name, role, seat)
                 else:
                     Messages.add(
-                        f"Failed to assign {winner.name} as {vote.role} (seat {vote.seat_number}); restarting nominations")
-                    logger.warning(f"Assignment failed for {winner.name} as {vote.role} seat {vote.seat_number}")
-                    self.queued_seats.setdefault(vote.role, []).insert(0, vote.seat_number)
-                self.active_votes.remove(vote)
-                if vote.role in self.vote_interfaces:
-                    del self.vote_interfaces[vote.role]
-                if self.queued_seats.get(vote.role):
-                    self.initiate_votes()
+                        f"Failed to assign {winner.name} as {role} (seat {seat}); restarting nominations")
+                    logger.warning(f"Assignment failed for {winner.name} as {role} seat {seat}")
+                    self.queued_seats.setdefault(role, deque()).appendleft(seat)
+                finished.append(vote)
+                self.vote_interfaces.pop(role, None)
+                if self.queued_seats.get(role):
+                    needs_reinit = True
+        if finished:
+            self.remove_votes(finished)
+        if needs_reinit:
+            self.initiate_votes()
 
     def handle_vote(self, role: str):
         """Handle a player's vote for a role."""
@@ -154,10 +234,12 @@ class VotingManager:
             return
         print(interface.display_vote_options())
         vote_data = input("Enter your vote (e.g., 'Bob' or 'Bob,Cleo' for ranked choice): ").strip()
+        current_player = self.sim.current_player
         try:
-            interface.handle_vote(self.sim.players[self.sim.current_player_index], vote_data)
-            Messages.add(f"{self.sim.players[self.sim.current_player_index].name} voted for {vote_data} in {role} election")
-            logger.debug(f"{self.sim.players[self.sim.current_player_index].name} voted for {vote_data} in {role} election")
+            interface.handle_vote(current_player, vote_data)
+            self._dirty = True
+            Messages.add(f"{current_player.name} voted for {vote_data} in {role} election")
+            logger.debug("%s voted for %s in %s election", current_player.name, vote_data, role)
         except ValueError as e:
             print(f"Error: {e}")
             logger.error(f"Vote error for {role}: {e}")
@@ -1,20 +1,28 @@
-from typing import List, Optional
+import sys
+from itertools import chain
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Optional, Tuple
 import random
 
 class Innovation:
+    __slots__ = ("name", "description", "icon", "prerequisites", "prerequisites_ordered", "tags", "cost", "discovered",
+                 "roles")
+
     def __init__(self, name: str, description: str = "", icon: Optional[str] = None,
                  prerequisites: Optional[List[str]] = None, tags: Optional[List[str]] = None,
                  cost: int = 10):
-        self.name = name
+        self.name = sys.intern(name)
         self.description = description
         self.icon = icon
-        self.prerequisites = prerequisites or []
-        self.tags = tags or []
+        self.prerequisites: FrozenSet[str] = frozenset(sys.intern(p) for p in prerequisites or ())
+        self.prerequisites_ordered: Tuple[str, ...] = tuple(sorted(self.prerequisites))
+        self.tags: Tuple[str, ...] = tuple(tags or ())
         self.cost = cost
         self.discovered = False
+        self.roles: FrozenSet[str] = frozenset()  # Base roles whose innovation list includes this one
 
     def is_discoverable(self, discovered_names: set) -> bool:
-        return all(prereq in discovered_names for prereq in self.prerequisites)
+        return not self.prerequisites or self.prerequisites.issubset(discovered_names)
 
     def __repr__(self):
         return f"<Innovation {self.name} (Cost: {self.cost})>"
@@ -23,6 +31,26 @@ class InnovationPool:
     def __init__(self):
         self.discovered = set()
         self.points = 100  # Total accumulated innovation points
+        self.version = 0  # Bumped whenever discovered changes
+        self.discovered_mask = 0  # Bitmask of discovered, see INNOVATION_BITS
+        self._discovered_names_cache: Optional[str] = None
+        self._discoverable_names = set(DISCOVERABLE_NOW)  # Kept up to date by add_discovered
+        self._discoverable_cache: Optional[Tuple['Innovation', ...]] = None
+
+    def add_discovered(self, name: str):
+        """Mark an innovation as discovered without spending points."""
+        if name not in self.discovered:
+            name = sys.intern(name)
+            self.discovered.add(name)
+            self.discovered_mask |= innovation_bit(name)
+            self.version += 1
+            self._discovered_names_cache = None
+            self._discoverable_cache = None
+            # Only innovations that list this one as a prerequisite can have become discoverable
+            self._discoverable_names.discard(name)
+            for candidate in PREREQ_OF.get(name, ()):
+                if candidate.name not in self.discovered and candidate.is_discoverable(self.discovered):
+                    self._discoverable_names.add(candidate.name)
 
     def add_points(self, points: int):
         """Add innovation points to the pool."""
@@ -41,28 +69,42 @@ class InnovationPool:
             raise ValueError(f"Unknown innovation: {name}")
         innovation = ALL_INNOVATIONS[name]
         if innovation.is_discoverable(self.discovered) and self.points >= innovation.cost:
-            self.discovered.add(name)
+            self.add_discovered(innovation.name)
             self.points -= innovation.cost
             return True
         return False
 
     def discover_random(self) -> Optional[str]:
         """Attempt to discover a random innovation if enough points are available."""
-        discoverable = self.get_discoverable()
-        affordable = [i for i in discoverable if i.cost <= self.points]
+        points = self.points
+        affordable = [i for i in self._discoverable() if i.cost <= points]
         if not affordable:
             return None
         innovation = random.choice(affordable)
-        self.discovered.add(innovation.name)
+        self.add_discovered(innovation.name)
         self.points -= innovation.cost
         return innovation.name
 
+    @property
+    def discovered_names_str(self) -> str:
+        """Comma-separated discovered innovation names for display, or "None"."""
+        if self._discovered_names_cache is None:
+            self._discovered_names_cache = ", ".join(i.name for i in self.get_discovered()) or "None"
+        return self._discovered_names_cache
+
     def get_discovered(self) -> List['Innovation']:
         return [ALL_INNOVATIONS[n] for n in self.discovered]
 
+    def _discoverable(self) -> Tuple['Innovation', ...]:
+        """Discoverable innovations in registry order, rebuilt only after a discovery."""
+        if self._discoverable_cache is None:
+            self._discoverable_cache = tuple(
+                ALL_INNOVATIONS[name] for name in sorted(self._discoverable_names, key=REGISTRY_ORDER.__getitem__)
+            )
+        return self._discoverable_cache
+
     def get_discoverable(self) -> List['Innovation']:
-        return [i for i in ALL_INNOVATIONS.values()
-                if i.name not in self.discovered and i.is_discoverable(self.discovered)]
+        return list(self._discoverable())
 
     def __repr__(self):
         return f"<InnovationPool Points: {self.points}, Discovered: {sorted(self.discovered)}>"
@@ -168,14 +210,45 @@ CIVIC_REPRESENTATION_INNOVATIONS = [
 ]
 
 
+INNOVATION_LISTS = {
+    "leadership": LEADERSHIP_INNOVATIONS,
+    "military": MILITARY_INNOVATIONS,
+    "legislative": LEGISLATIVE_INNOVATIONS,
+    "judicial": JUDICIAL_INNOVATIONS,
+    "intelligence": INTELLIGENCE_INNOVATIONS,
+    "economic": ECONOMIC_INNOVATIONS,
+    "infrastructure": INFRASTRUCTURE_INNOVATIONS,
+    "religious": RELIGIOUS_INNOVATIONS,
+    "civic_representation": CIVIC_REPRESENTATION_INNOVATIONS,
+}
+
 # Global innovation registry
-ALL_INNOVATIONS = {}
+_INNOVATION_REGISTRY: Dict[str, Innovation] = {}
+ALL_INNOVATIONS = MappingProxyType(_INNOVATION_REGISTRY)  # Read-only; only register_innovations() fills it
+REGISTRY_ORDER: Dict[str, int] = {}  # Registration position, keeps discoverable listings stable
+PREREQ_OF: Dict[str, List[Innovation]] = {}  # Prerequisite name -> innovations that require it
+DISCOVERABLE_NOW: set = set()  # Innovations with no prerequisites
 def register_innovations():
-    for innovation_list in [
-        LEADERSHIP_INNOVATIONS, MILITARY_INNOVATIONS, LEGISLATIVE_INNOVATIONS,
-        JUDICIAL_INNOVATIONS, INTELLIGENCE_INNOVATIONS, ECONOMIC_INNOVATIONS,
-        INFRASTRUCTURE_INNOVATIONS, RELIGIOUS_INNOVATIONS, CIVIC_REPRESENTATION_INNOVATIONS
-    ]:
+    for role, innovation_list in INNOVATION_LISTS.items():
         for innovation in innovation_list:
-            ALL_INNOVATIONS[innovation.name] = innovation
-register_innovations()
\ No newline at end of file
+            innovation.roles = innovation.roles | {sys.intern(role)}
+    _INNOVATION_REGISTRY.update(
+        (innovation.name, innovation) for innovation in chain.from_iterable(INNOVATION_LISTS.values())
+    )
+    REGISTRY_ORDER.clear()
+    PREREQ_OF.clear()
+    DISCOVERABLE_NOW.clear()
+    for index, innovation in enumerate(ALL_INNOVATIONS.values()):
+        REGISTRY_ORDER[innovation.name] = index
+        for prereq in innovation.prerequisites_ordered:
+            PREREQ_OF.setdefault(prereq, []).append(innovation)
+        if not innovation.prerequisites:
+            DISCOVERABLE_NOW.add(innovation.name)
+register_innovations()
+
+# Bit per registered innovation, for command availability checks against InnovationPool.discovered_mask
+INNOVATION_BITS: Dict[str, int] = {name: 1 << index for index, name in enumerate(ALL_INNOVATIONS)}
+
+def innovation_bit(name: str) -> int:
+    """Get the bit for an innovation name, allocating one for names outside the registry."""
+    return INNOVATION_BITS.setdefault(name, 1 << len(INNOVATION_BITS))
\ No newline at end of file
@@ -1,23 +1,10 @@
-from innovations.innovation import (
-    LEADERSHIP_INNOVATIONS,
-    MILITARY_INNOVATIONS,
-    LEGISLATIVE_INNOVATIONS,
-    JUDICIAL_INNOVATIONS,
-    INTELLIGENCE_INNOVATIONS,
-    ECONOMIC_INNOVATIONS,
-    INFRASTRUCTURE_INNOVATIONS,
-    RELIGIOUS_INNOVATIONS,
-    CIVIC_REPRESENTATION_INNOVATIONS,
-)
+from innovations.innovation import ALL_INNOVATIONS, INNOVATION_LISTS
 
+# Derived from the single ALL_INNOVATIONS registry via each innovation's roles, in definition order
 ROLE_INNOVATION_MAP = {
-    "leadership": LEADERSHIP_INNOVATIONS,
-    "military": MILITARY_INNOVATIONS,
-    "legislative": LEGISLATIVE_INNOVATIONS,
-    "judicial": JUDICIAL_INNOVATIONS,
-    "intelligence": INTELLIGENCE_INNOVATIONS,
-    "economic": ECONOMIC_INNOVATIONS,
-    "infrastructure": INFRASTRUCTURE_INNOVATIONS,
-    "religious": RELIGIOUS_INNOVATIONS,
-    "civic_representation": CIVIC_REPRESENTATION_INNOVATIONS,
-}
\ No newline at end of file
+    role: tuple(innov for innov in ALL_INNOVATIONS.values() if role in innov.roles)
+    for role in INNOVATION_LISTS
+}
+
+# Reverse of ROLE_INNOVATION_MAP: innovation name -> base roles that can research it
+INNOVATION_TO_ROLES = {name: innov.roles for name, innov in ALL_INNOVATIONS.items()}
\ No newline at end of file
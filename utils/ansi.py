@@ -0,0 +1,14 @@
+import os
+
+# Honour the NO_COLOR convention (https://no-color.org): any non-empty value turns the codes into empty strings
+USE_COLOR = not os.environ.get("NO_COLOR")
+
+YELLOW = "\033[93m" if USE_COLOR else ""
+CYAN = "\033[96m" if USE_COLOR else ""
+RED = "\033[91m" if USE_COLOR else ""
+RESET = "\033[0m" if USE_COLOR else ""
+
+# Clear the screen and home the cursor; not a colour, so NO_COLOR leaves it alone
+CLEAR_SEQUENCE = "\033[2J\033[H"
+
+SEP = "__________________________________\n"
@@ -1,5 +1,35 @@
 import random
-from typing import List, Optional, Dict
+from typing import Callable, List, Optional, Dict, Tuple
+
+
+def _build_alias_table(weights: List[float]) -> Tuple[List[float], List[int]]:
+    """
+    Build a Vose alias table so a weighted face can be drawn in constant time.
+
+    Args:
+        weights: Relative weight of each face; need not sum to 1.
+
+    Returns:
+        Tuple of (probability of keeping each face, face to fall back to otherwise).
+    """
+    n = len(weights)
+    total = sum(weights)
+    if total <= 0 or any(w < 0 for w in weights):
+        raise ValueError("Weights must be non-negative with a positive total")
+    scaled = [w * n / total for w in weights]
+    prob = [1.0] * n
+    alias = list(range(n))
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+    while small and large:
+        s = small.pop()
+        l = large.pop()
+        prob[s] = scaled[s]
+        alias[s] = l
+        scaled[l] += scaled[s] - 1.0
+        (small if scaled[l] < 1.0 else large).append(l)
+    # Whatever is left over is 1 up to rounding error and keeps the defaults
+    return prob, alias
 
 
 class Die:
@@ -9,17 +39,20 @@ class Die:
 
         Args:
             faces: Number of faces (e.g., 6 for a d6).
-            weights: Optional list of probabilities for each face (must sum to 1 if provided).
-            seed: Optional random seed for reproducibility.
+            weights: Optional relative weight of each face; normalized, so they need not sum to 1.
+            seed: Optional seed for a generator private to this die; without one the die shares the global random state.
         """
         if faces < 1:
             raise ValueError("Die must have at least one face")
         self.faces = faces
-        self.weights = weights if weights else [1.0 / faces] * faces
-        if len(self.weights) != faces:
-            raise ValueError("Weights length must match number of faces")
-        if seed is not None:
-            random.seed(seed)
+        self.weights = weights or None  # None for a fair die
+        self._uniform = self.weights is None
+        if not self._uniform:
+            if len(self.weights) != faces:
+                raise ValueError("Weights length must match number of faces")
+            self._prob, self._alias = _build_alias_table(self.weights)
+        # The random module exposes the same methods as a Random instance, so either works as the generator
+        self._rng = random.Random(seed) if seed is not None else random
 
     def roll(self, success_threshold: Optional[int] = None) -> tuple[int, bool]:
         """
@@ -34,7 +67,11 @@ class Die:
         if success_threshold is not None and (success_threshold < 1 or success_threshold > self.faces):
             raise ValueError(f"Success threshold must be between 1 and {self.faces}")
 
-        value = random.choices(range(1, self.faces + 1), weights=self.weights, k=1)[0]
+        if self._uniform:
+            value = self._rng.randint(1, self.faces)
+        else:
+            face = self._rng.randrange(self.faces)
+            value = (face if self._rng.random() < self._prob[face] else self._alias[face]) + 1
         success = value >= success_threshold if success_threshold is not None else True
         return value, success
 
@@ -43,10 +80,12 @@ class DiceBag:
     def __init__(self):
         """A collection of dice, accessible by key (e.g., 'd6', 'd20')."""
         self.dice: Dict[str, Die] = {}
-        # Default dice for common use cases
-        self.add_die("d6", Die(6))  # Standard 6-sided die
-        self.add_die("d20", Die(20))  # 20-sided die for complex outcomes
-        self.add_die("d100", Die(100))  # Percentile die
+        # Default dice for common use cases, built on first roll
+        self._factories: Dict[str, Callable[[], Die]] = {
+            "d6": lambda: Die(6),  # Standard 6-sided die
+            "d20": lambda: Die(20),  # 20-sided die for complex outcomes
+            "d100": lambda: Die(100),  # Percentile die
+        }
 
     def add_die(self, key: str, die: Die):
         """Add a die to the bag with a unique key."""
@@ -64,6 +103,8 @@ class DiceBag:
             Tuple of (rolled value, success boolean).
         """
         die = self.dice.get(die_key)
+        if die is None and die_key in self._factories:
+            die = self.dice[die_key] = self._factories[die_key]()
         if not die:
             raise ValueError(f"No die found with key '{die_key}'")
         return die.roll(success_threshold)
\ No newline at end of file
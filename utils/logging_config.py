@@ -1,8 +1,19 @@
+import atexit
 import logging
 import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+_listener = None  # Background QueueListener doing the file I/O, stopped at exit
+
+def _stop_listener():
+    """Drain queued records to the handlers on shutdown."""
+    if _listener is not None:
+        _listener.stop()
 
 def setup_logging():
     """Configure the logging system for GovGen."""
+    global _listener
     # Create logger
     logger = logging.getLogger('govgen')
     logger.setLevel(logging.ERROR)  # Only log ERROR and above
@@ -16,7 +27,7 @@ def setup_logging():
     console_handler.setLevel(logging.DEBUG)
     console_formatter = logging.Formatter('%(asctime)s | %(levelname)s | %(name)s | %(message)s')
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
+    logger.addHandler(console_handler)  # Kept synchronous so errors print in step with the interactive screen
 
     # File handler for ERROR and above
     log_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'govgen.log')
@@ -24,7 +35,13 @@ def setup_logging():
     file_handler.setLevel(logging.DEBUG)
     file_formatter = logging.Formatter('%(asctime)s | %(levelname)s | %(name)s | %(message)s')
     file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
+
+    # Callers only enqueue records for the file; a background thread does the writes
+    log_queue = queue.Queue(-1)
+    _listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    logger.addHandler(QueueHandler(log_queue))
+    _listener.start()
+    atexit.register(_stop_listener)
 
     return logger
 
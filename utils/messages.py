@@ -1,28 +1,47 @@
-from typing import List
+from collections import deque
+from typing import Deque, Optional
+from utils.ansi import YELLOW, RESET
 from utils.logging_config import logger
 
+_messages: Deque[str] = deque()  # Messages, already wrapped in yellow
+_joined: Optional[str] = None  # to_str() result, reset whenever the queue changes
+
+
+def add(message: str):
+    """Add a message to the queue and log it."""
+    global _joined
+    _messages.append(f"{YELLOW}{message}{RESET}")
+    _joined = None
+    logger.debug("Message added: %s", message)
+
+
+def clear():
+    """Clear all messages."""
+    global _joined
+    _messages.clear()
+    _joined = None
+    logger.debug("Messages cleared")
+
+
+def is_empty() -> bool:
+    """Check whether no messages are queued."""
+    return not _messages
+
+
+def to_str() -> str:
+    """Return all messages as a yellow-colored string for display."""
+    global _joined
+    if not _messages:
+        return ""
+    if _joined is None:
+        _joined = "\n".join(_messages)
+        logger.debug("Messages retrieved: %s", _joined)
+    return _joined
+
+
 class Messages:
-    _messages: List[str] = []
-
-    @classmethod
-    def add(cls, message: str):
-        """Add a message to the queue and log it."""
-        cls._messages.append(message)
-        logger.debug(f"Message added: {message}")
-
-    @classmethod
-    def clear(cls):
-        """Clear all messages."""
-        cls._messages = []
-        logger.debug("Messages cleared")
-
-    @classmethod
-    def to_str(cls) -> str:
-        """Return all messages as a yellow-colored string for display."""
-        if not cls._messages:
-            return ""
-        yellow = "\033[93m"
-        reset = "\033[0m"
-        message_str = "\n".join(f"{yellow}{msg}{reset}" for msg in cls._messages)
-        logger.debug(f"Messages retrieved: {message_str}")
-        return message_str
\ No newline at end of file
+    """Namespace over the module-level queue; staticmethods skip the classmethod binding on every call."""
+    add = staticmethod(add)
+    clear = staticmethod(clear)
+    is_empty = staticmethod(is_empty)
+    to_str = staticmethod(to_str)
\ No newline at end of file
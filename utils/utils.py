@@ -14,15 +14,16 @@ def choose_from_list(options, prompt, display_func=lambda x: str(x)):
     if not options:
         print("No options available.")
         return None
-    print(prompt)
-    for i, option in enumerate(options, 1):
-        print(f"  {i}: {display_func(option)}")
+    lines = [prompt]
+    lines.extend(f"  {i}: {display_func(option)}" for i, option in enumerate(options, 1))
+    print("\n".join(lines))
+    count = len(options)
     while True:
-        try:
-            choice = int(input("Enter number: "))
-            if 1 <= choice <= len(options):
-                return options[choice - 1]
-            else:
-                print("Invalid number.")
-        except ValueError:
-            print("Please enter a number.")
\ No newline at end of file
+        choice = input("Enter number: ").strip()
+        if not choice.isdecimal():
+            print("Please enter a number.")
+            continue
+        index = int(choice)
+        if 1 <= index <= count:
+            return options[index - 1]
+        print("Invalid number.")
\ No newline at end of file
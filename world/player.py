@@ -1,6 +1,9 @@
 
 
 class Player:
+    __slots__ = ("id", "name", "age", "description", "charisma", "intelligence", "strength", "traits",
+                 "assigned_roles", "_assigned_roles_set")
+
     def __init__(self, player_id, name, age, description, charisma, intelligence, strength, traits=None):
         self.id = player_id
         self.name = name
@@ -10,19 +13,33 @@ class Player:
         self.intelligence = intelligence
         self.strength = strength
         self.traits = traits or []
-        self.assigned_roles = []
+        self.assigned_roles = []  # In assignment order, for display
+        self._assigned_roles_set = set()  # Same roles, for membership checks
+
+    def has_role(self, role_name):
+        return role_name in self._assigned_roles_set
 
     def assign_role(self, role_name):
-        if role_name not in self.assigned_roles:
+        if role_name not in self._assigned_roles_set:
+            self._assigned_roles_set.add(role_name)
             self.assigned_roles.append(role_name)
 
+    def unassign_role(self, role_name):
+        if role_name in self._assigned_roles_set:
+            self._assigned_roles_set.discard(role_name)
+            self.assigned_roles.remove(role_name)
+
+    def clear_roles(self):
+        self.assigned_roles = []
+        self._assigned_roles_set = set()
+
     def __str__(self):
         return (f"Player {self.name} (Age {self.age}) - {self.description} | "
                 f"Stats: CHA {self.charisma}, INT {self.intelligence}, STR {self.strength} | "
                 f"Roles: {', '.join(self.assigned_roles) or 'None'}")
 
-# Static list of dummy test players
-players = [
+# Static roster of dummy test players
+players = (
     Player(
         player_id=1,
         name="Alice",
@@ -63,17 +80,19 @@ players = [
         strength=9,
         traits=["conservative", "respected"]
     ),
-]
+)
+
+# Lookup indexes over the static roster; the first player wins if a name or ID repeats
+_players_by_name = {}
+_players_by_id = {}
+for _p in players:
+    _players_by_name.setdefault(_p.name.lower(), _p)
+    _players_by_id.setdefault(_p.id, _p)
+del _p
 
 # Helper to get player by name or ID
 def get_player_by_name(name):
-    for p in players:
-        if p.name.lower() == name.lower():
-            return p
-    return None
+    return _players_by_name.get(name.lower())
 
 def get_player_by_id(pid):
-    for p in players:
-        if p.id == pid:
-            return p
-    return None
+    return _players_by_id.get(pid)